@@ -75,6 +75,12 @@ class Camera(QtCore.QObject):
         self._buffer_index = 0
         self._current_index = 0
 
+        # Number of frames captured so far, identifying the current frame
+        self._frame_generation = 0
+
+        # Undistorted current frame: (frame_generation, calibration_data, frame)
+        self._undistorted_frame_cache: tuple | None = None
+
         # Connect frame captured signal
         self.camera_feed.frame_captured.connect(self._on_frame_captured)
 
@@ -88,11 +94,13 @@ class Camera(QtCore.QObject):
         # Increment and wrap buffer index
         self._buffer_index = (self._buffer_index + 1) % 3
 
-        # Store frame in buffer (no copy needed - frame is never modified)
+        # Store frame in buffer (no copy needed - frame is never modified, and the
+        # feed never decodes into a buffer that is still referenced)
         self._frame_buffer[self._buffer_index] = frame
 
         # Update current index
         self._current_index = self._buffer_index
+        self._frame_generation += 1
 
     def get_frame(self) -> np.ndarray | None:
         """Get the current frame from the buffer.
@@ -102,6 +110,17 @@ class Camera(QtCore.QObject):
         """
         return self._frame_buffer[self._current_index]
 
+    def get_frame_generation(self) -> int:
+        """Get the generation of the current frame.
+
+        The generation increases with every captured frame, so an unchanged value
+        means get_frame() and get_undistorted_frame() still return the same image.
+
+        Returns:
+            Number of frames captured so far.
+        """
+        return self._frame_generation
+
     def get_undistorted_frame(self) -> np.ndarray | None:
         """Get the current undistorted frame.
 
@@ -115,9 +134,19 @@ class Camera(QtCore.QObject):
         if frame is None:
             return None
 
-        # If calibrated, apply undistortion rectification
-        if self.calibration_data is not None:
-            return self.calibration_data.undistort_rectification.undistort_frame(frame)
+        # If calibrated, apply undistortion rectification (once per captured frame,
+        # the result is shared like the raw frame and must not be modified)
+        calibration_data = self.calibration_data
+        if calibration_data is not None:
+            cached = self._undistorted_frame_cache
+            if cached is None or cached[0] != self._frame_generation or cached[1] is not calibration_data:
+                cached = (
+                    self._frame_generation,
+                    calibration_data,
+                    calibration_data.undistort_rectification.undistort_frame(frame)
+                )
+                self._undistorted_frame_cache = cached
+            return cached[2]
 
         return frame
 
@@ -20,6 +20,8 @@ using OpenCV and emits them via PySide6 signals with proper frame rate limiting.
 
 from __future__ import annotations
 
+import os
+import sys
 import threading
 from typing import Optional
 
@@ -46,6 +48,51 @@ DEFAULT_CAPTURE_PROPERTIES: dict[int, int | float] = {
     cv.CAP_PROP_ZOOM: 100
 }
 
+# Properties OpenCV only honors when passed at open time (set() after opening is ignored)
+OPEN_ONLY_CAPTURE_PROPERTIES: tuple[int, ...] = (
+    cv.CAP_PROP_HW_ACCELERATION,
+    cv.CAP_PROP_HW_DEVICE,
+)
+
+# Capture backends that accept hardware-accelerated decoding open parameters
+HW_ACCELERATION_BACKENDS: tuple[int, ...] = (
+    cv.CAP_MSMF,
+    cv.CAP_FFMPEG,
+    cv.CAP_GSTREAMER,
+)
+
+# FFmpeg options for RTSP sources: UDP transport with a small jitter buffer avoids
+# TCP retransmit stalls. Only in the environment while an RTSP URL is being opened.
+FFMPEG_CAPTURE_OPTIONS = "rtsp_transport;udp|buffer_size;65536|max_delay;500000"
+
+# Capture backends that may open a URL through FFmpeg
+FFMPEG_BACKENDS: tuple[int, ...] = (
+    cv.CAP_ANY,
+    cv.CAP_FFMPEG,
+)
+
+# Number of frame buffers the capture thread cycles through. A buffer is only
+# decoded into again once nothing else references it (queued signals, frame
+# history, views, QImages wrapping its data); otherwise a new one is allocated.
+FRAME_POOL_SIZE = 8
+
+
+def _get_free_buffer_refcount() -> int:
+    """Get the reference count of a pool buffer that nothing else references.
+
+    Measured the same way the capture loop checks its buffers (held by the pool
+    list and a local variable), so it follows the interpreter's counting.
+
+    Returns:
+        Reference count reported by sys.getrefcount for a free buffer.
+    """
+    pool = [np.empty(1, dtype=np.uint8)]
+    buffer = pool[0]
+    return sys.getrefcount(buffer)
+
+
+_FREE_BUFFER_REFCOUNT = _get_free_buffer_refcount()
+
 
 def get_frame_with_text(
     text: str,
@@ -114,6 +161,8 @@ class CameraFeed(QObject):
     Signals:
         frame_captured: Emitted when a frame is available. Passes (frame: np.ndarray, success: bool).
             success=True for actual camera frames, False for error message frames.
+            Camera frames are decoded into a pool of FRAME_POOL_SIZE buffers, each
+            reused only once the previous frame in it is no longer referenced.
         error_occurred: Emitted when an error occurs, passes error message string.
 
     Attributes:
@@ -164,6 +213,10 @@ class CameraFeed(QObject):
 
         self._last_frame_resolution: tuple[int, int] = (0, 0)
 
+        # Preallocated frame buffers decoded into by the capture thread
+        self._frame_pool: list[np.ndarray | None] = [None] * FRAME_POOL_SIZE
+        self._frame_pool_index: int = 0
+
         self._capture_properties: dict[int, int | float] = DEFAULT_CAPTURE_PROPERTIES.copy()
         if capture_properties is not None:
             self._capture_properties.update(capture_properties)
@@ -175,7 +228,7 @@ class CameraFeed(QObject):
             True if initialization succeeded, False otherwise.
         """
         try:
-            self._capture = cv.VideoCapture(self.device_id, self.capture_api)
+            self._capture = self._open_capture()
 
             if not self._capture.isOpened():
                 error_msg = f"Failed to open camera device {self.device_id}"
@@ -190,7 +243,8 @@ class CameraFeed(QObject):
                 return False
 
             for prop, value in self._capture_properties.items():
-                self._capture.set(prop, value)
+                if prop not in OPEN_ONLY_CAPTURE_PROPERTIES:
+                    self._capture.set(prop, value)
 
             return True
 
@@ -206,6 +260,51 @@ class CameraFeed(QObject):
             self.frame_captured.emit(error_frame, False)
             return False
 
+    def _open_capture(self) -> cv.VideoCapture:
+        """Open the video capture device, with FFmpeg RTSP options for RTSP sources.
+
+        FFmpeg reads OPENCV_FFMPEG_CAPTURE_OPTIONS from the environment when a
+        capture is opened, so for an RTSP URL it is set for the duration of the
+        open only and then restored. A value already set by the user is kept.
+
+        Returns:
+            The opened (or failed) VideoCapture instance.
+        """
+        is_rtsp = (self.capture_api in FFMPEG_BACKENDS and isinstance(self.device_id, str) and
+                   self.device_id.lower().startswith("rtsp://"))
+        if not is_rtsp or "OPENCV_FFMPEG_CAPTURE_OPTIONS" in os.environ:
+            return self._open_capture_device()
+
+        os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = FFMPEG_CAPTURE_OPTIONS
+        try:
+            return self._open_capture_device()
+        finally:
+            del os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"]
+
+    def _open_capture_device(self) -> cv.VideoCapture:
+        """Open the video capture device, requesting hardware decoding when supported.
+
+        Open-only properties (hardware acceleration) are passed as open parameters
+        for backends that support them. If the device cannot be opened with them,
+        it is reopened without, falling back to software decoding.
+
+        Returns:
+            The opened (or failed) VideoCapture instance.
+        """
+        if self.capture_api in HW_ACCELERATION_BACKENDS:
+            open_params = []
+            for prop in OPEN_ONLY_CAPTURE_PROPERTIES:
+                if prop in self._capture_properties:
+                    open_params.extend([prop, int(self._capture_properties[prop])])
+
+            if open_params:
+                capture = cv.VideoCapture(self.device_id, self.capture_api, open_params)
+                if capture.isOpened():
+                    return capture
+                capture.release()
+
+        return cv.VideoCapture(self.device_id, self.capture_api)
+
     def _capture_loop(self) -> None:
         """Main capture loop running in a separate thread.
 
@@ -224,7 +323,13 @@ class CameraFeed(QObject):
                 self.frame_captured.emit(error_frame, False)
                 break
 
-            ret, frame = self._capture.read()
+            # Decode into the next pooled buffer (OpenCV reallocates it only on size
+            # change), unless the frame in it is still referenced outside the pool
+            slot = self._frame_pool_index
+            buffer = self._frame_pool[slot]
+            if buffer is not None and sys.getrefcount(buffer) > _FREE_BUFFER_REFCOUNT:
+                buffer = None
+            ret, frame = self._capture.read(buffer)
 
             if not ret:
                 error_msg = "Failed to read frame from camera"
@@ -238,6 +343,10 @@ class CameraFeed(QObject):
                 self.frame_captured.emit(error_frame, False)
                 continue
 
+            # Keep the (possibly reallocated) buffer for reuse and advance the pool
+            self._frame_pool[slot] = frame
+            self._frame_pool_index = (slot + 1) % FRAME_POOL_SIZE
+
             # Update frame resolution
             with self._lock:
                 height, width = frame.shape[:2]
@@ -30,3 +30,7 @@ SAVED_MASTER_CONFIGURATIONS_DIR_PATH = os.path.join(SAVED_ROOT_DIR_PATH, "master
 VERTEX_RADIUS = 12  # Radius in pixels for vertex circles
 EDGE_THICKNESS = 1  # Thickness in pixels for edges
 VERTEX_CIRCLE_THICKNESS = 2  # Thickness in pixels for vertex circles
+OVERLAY_TILE_SIZE = 16  # Tile size in pixels for skipping transparent overlay areas
+
+# Viewport constants
+ZOOM_NEAREST_MAGNIFICATION = 3  # Zoomed cells magnified past this use nearest-neighbor (crisp source pixels)
@@ -224,3 +224,40 @@ class GameBase(ABC):
             ...     return self.projector_overlays.get(zone_name)
         """
         return None
+
+    def get_camera_overlay_revision(self, zone_name: str):
+        """Get the revision of the camera overlay image for a specific zone.
+
+        Override this method alongside get_camera_overlay to let the viewport reuse
+        its warped copy of the overlay while the image is unchanged. The returned
+        value must change every time the overlay pixels are modified.
+
+        Args:
+            zone_name: Name of the zone to get overlay revision for.
+
+        Returns:
+            Hashable revision (e.g. a counter incremented on each redraw), or None
+            if unknown, in which case the overlay is re-warped on every frame.
+
+        Example:
+            >>> def get_camera_overlay_revision(self, zone_name):
+            ...     return self.overlay_revisions.get(zone_name)
+        """
+        return None
+
+    def get_projector_overlay_revision(self, zone_name: str):
+        """Get the revision of the projector overlay image for a specific zone.
+
+        Same contract as get_camera_overlay_revision, for get_projector_overlay.
+
+        Args:
+            zone_name: Name of the zone to get overlay revision for.
+
+        Returns:
+            Hashable revision, or None if unknown.
+
+        Example:
+            >>> def get_projector_overlay_revision(self, zone_name):
+            ...     return self.overlay_revisions.get(zone_name)
+        """
+        return None
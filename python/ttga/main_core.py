@@ -240,6 +240,34 @@ class MainCore(QtCore.QObject):
             return None
         return self.current_game.get_projector_overlay(zone_name)
 
+    def get_game_camera_overlay_revision(self, zone_name: str):
+        """Get the camera overlay revision from the current game for a specific zone.
+
+        Args:
+            zone_name: Name of the zone to get overlay revision for.
+
+        Returns:
+            Revision that changes whenever the overlay is redrawn,
+            or None if no game loaded or the game does not track revisions.
+        """
+        if self.current_game is None:
+            return None
+        return self.current_game.get_camera_overlay_revision(zone_name)
+
+    def get_game_projector_overlay_revision(self, zone_name: str):
+        """Get the projector overlay revision from the current game for a specific zone.
+
+        Args:
+            zone_name: Name of the zone to get overlay revision for.
+
+        Returns:
+            Revision that changes whenever the overlay is redrawn,
+            or None if no game loaded or the game does not track revisions.
+        """
+        if self.current_game is None:
+            return None
+        return self.current_game.get_projector_overlay_revision(zone_name)
+
     def allows_locked_corner_adjustment(self) -> bool:
         """Check if the current game allows corner adjustments when calibrated.
 
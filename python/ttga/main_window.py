@@ -87,7 +87,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.viewport.set_get_frames_callback(
             self._get_selected_camera_frames,
             self._get_selected_camera_ids,
-            self._get_selected_camera_names
+            self._get_selected_camera_names,
+            self._get_selected_camera_frame_generations
         )
         self.viewport.set_zone_manager(self.core.zone_manager)
         self.viewport.set_main_core(self.core)
@@ -2264,6 +2265,27 @@ class MainWindow(QtWidgets.QMainWindow):
         selected_items = self.camera_list.selectedItems()
         return [hash(item.text()) for item in selected_items]
 
+    def _get_selected_camera_frame_generations(self) -> list[int]:
+        """Get frame generations of selected cameras to detect new frames.
+
+        Returns:
+            List of frame generations, in the same order as the frames.
+        """
+        generations = []
+        selected_items = self.camera_list.selectedItems()
+
+        for item in selected_items:
+            camera_name = item.text()
+            try:
+                camera = self.core.camera_manager.get_camera(camera_name)
+                if camera.get_frame() is not None:
+                    generations.append(camera.get_frame_generation())
+            except KeyError:
+                # Camera was removed
+                pass
+
+        return generations
+
     def _get_selected_camera_names(self) -> list[str]:
         """Get names of selected cameras for zone overlay compositing.
 
@@ -0,0 +1,298 @@
+# Copyright 2026 Marc-Antoine Desjardins
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Overlay warping module shared by the camera and projector viewports.
+
+This module prepares BGRA overlays for Qt compositing and warps game overlays
+from game coordinates into camera or projector coordinates, reusing the
+previous warp of a zone where its inputs did not change.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import cv2 as cv
+import numpy as np
+from PySide6 import QtCore, QtGui
+
+
+@dataclass(slots=True)
+class GameOverlayWarp:
+    """Warped game overlay of a zone, cached between display frames.
+
+    Attributes:
+        inputs_key: (overlay id, revision, matrix bytes, ROI bounds, width, height,
+            target_size) the warp was made from.
+        game_overlay: Game overlay (numpy BGRA) the warp was made from.
+        has_content: Whether the game overlay has any non-transparent pixel.
+        overlay_argb: Warped premultiplied overlay, or None if there is nothing to draw.
+        overlay_qimage: QImage over overlay_argb, or None if there is nothing to draw.
+        x: Overlay x position in the output.
+        y: Overlay y position in the output.
+        game_pixels: Copy of the game overlay pixels, to find the ones that changed.
+        tiles: Areas of the overlay worth compositing, set by the viewport drawing
+            it (None until computed).
+    """
+    inputs_key: tuple
+    game_overlay: np.ndarray
+    has_content: bool
+    overlay_argb: np.ndarray | None
+    overlay_qimage: QtGui.QImage | None
+    x: int
+    y: int
+    game_pixels: np.ndarray
+    tiles: list[tuple[QtCore.QPoint, QtCore.QRect]] | None = None
+
+
+def premultiply_overlay(overlay: np.ndarray) -> np.ndarray:
+    """Premultiply a BGRA overlay by its alpha for Qt compositing.
+
+    Premultiplied BGRA bytes are Qt's Format_ARGB32_Premultiplied on
+    little-endian hosts, the raster engine's native blending format: no
+    channel swap and no per-draw premultiplication are needed.
+
+    Args:
+        overlay: Overlay (numpy BGRA).
+
+    Returns:
+        Premultiplied overlay (numpy BGRA).
+    """
+    # The conversion only scales the first three channels by the fourth, so
+    # it applies to BGRA as well
+    return cv.cvtColor(overlay, cv.COLOR_RGBA2mRGBA)
+
+
+def scale_overlay(overlay_argb: np.ndarray, x: int, y: int, frame_width: int, frame_height: int, target_size: tuple[int, int]) -> tuple:
+    """Scale a full resolution overlay to match a frame scaled to target_size.
+
+    The overlay is premultiplied, so area-averaging makes anti-aliased edges
+    blend towards transparent instead of towards black.
+
+    Args:
+        overlay_argb: Premultiplied overlay (see premultiply_overlay) positioned
+            at (x, y) in the full frame.
+        x: Overlay x position in the full frame.
+        y: Overlay y position in the full frame.
+        frame_width: Width of the full frame.
+        frame_height: Height of the full frame.
+        target_size: (width, height) of the scaled frame.
+
+    Returns:
+        Tuple of (overlay_argb, overlay_qimage, x, y) in scaled frame coordinates,
+        where overlay_argb and overlay_qimage are None if nothing is left to draw.
+    """
+    target_width, target_height = target_size
+    scale_x = target_width / frame_width
+    scale_y = target_height / frame_height
+    ov_height, ov_width = overlay_argb.shape[:2]
+
+    # Scaled bounds, rounded outwards to whole pixels
+    x_start = int(x * scale_x)
+    y_start = int(y * scale_y)
+    x_end = min(target_width, int(np.ceil((x + ov_width) * scale_x)))
+    y_end = min(target_height, int(np.ceil((y + ov_height) * scale_y)))
+    scaled_width = x_end - x_start
+    scaled_height = y_end - y_start
+    if scaled_width <= 0 or scaled_height <= 0:
+        return None, None, 0, 0
+
+    scaled_argb = cv.resize(overlay_argb, (scaled_width, scaled_height), interpolation=cv.INTER_AREA)
+
+    scaled_qimage = QtGui.QImage(
+        scaled_argb.data, scaled_width, scaled_height, scaled_argb.strides[0],
+        QtGui.QImage.Format.Format_ARGB32_Premultiplied
+    )
+    return scaled_argb, scaled_qimage, x_start, y_start
+
+
+def warp_game_overlay(game_overlay: np.ndarray, matrix: np.ndarray, roi: dict, width: int, height: int) -> tuple:
+    """Warp a game overlay into camera or projector coordinates for compositing.
+
+    Args:
+        game_overlay: Game overlay (numpy BGRA) in game coordinates.
+        matrix: Game to camera (or projector) perspective transformation matrix.
+        roi: Camera (or projector) ROI of the zone.
+        width: Width of the camera frame (or projector).
+        height: Height of the camera frame (or projector).
+
+    Returns:
+        Tuple of (overlay_argb, overlay_qimage, x, y), where overlay_argb and
+        overlay_qimage are None if there is nothing to composite.
+    """
+    # Ensure we don't go out of frame bounds
+    x_start = max(0, roi['min_x'])
+    y_start = max(0, roi['min_y'])
+    x_end = min(width, roi['max_x'])
+    y_end = min(height, roi['max_y'])
+
+    # Calculate actual dimensions after bounds checking
+    actual_width = x_end - x_start
+    actual_height = y_end - y_start
+
+    if actual_width <= 0 or actual_height <= 0:
+        return None, None, 0, 0
+
+    # Premultiply in game space, then warp straight at the in-bounds size (the
+    # ROI is anchored top-left, so this equals warping the ROI and cropping).
+    # Interpolating premultiplied pixels also keeps edges from darkening.
+    overlay_argb = cv.warpPerspective(premultiply_overlay(game_overlay), matrix, (actual_width, actual_height))
+    overlay_qimage = QtGui.QImage(
+        overlay_argb.data, actual_width, actual_height, actual_width * 4,
+        QtGui.QImage.Format.Format_ARGB32_Premultiplied
+    )
+
+    return overlay_argb, overlay_qimage, x_start, y_start
+
+
+def get_dirty_rect(previous: np.ndarray, current: np.ndarray) -> tuple[int, int, int, int] | None:
+    """Get the bounding rectangle of the pixels that differ between two overlays.
+
+    Args:
+        previous: Previous overlay pixels.
+        current: Current overlay pixels.
+
+    Returns:
+        Tuple of (x0, y0, x1, y1) with exclusive end, the whole overlay if the
+        shapes differ, or None if the overlays are identical.
+    """
+    if previous.shape != current.shape:
+        return 0, 0, current.shape[1], current.shape[0]
+
+    changed = np.any(previous != current, axis=2)
+    rows = np.flatnonzero(changed.any(axis=1))
+    if rows.size == 0:
+        return None
+    cols = np.flatnonzero(changed.any(axis=0))
+    return int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
+
+
+def rewarp_game_overlay_rect(game_overlay: np.ndarray, matrix: np.ndarray, overlay_argb: np.ndarray, dirty_rect: tuple[int, int, int, int]) -> tuple:
+    """Update a warped game overlay in place where a game-space region changed.
+
+    Args:
+        game_overlay: Game overlay (numpy BGRA) in game coordinates.
+        matrix: Game to camera (or projector) perspective transformation matrix.
+        overlay_argb: Previous result of warp_game_overlay, updated in place.
+        dirty_rect: Changed game-space region as (x0, y0, x1, y1), exclusive end.
+
+    Returns:
+        Tuple of (overlay_argb, overlay_qimage) with a new QImage over the pixels.
+    """
+    height, width = overlay_argb.shape[:2]
+
+    # Bilinear sampling reaches one source pixel around the changed ones
+    x0, y0, x1, y1 = dirty_rect
+    corners = np.array([[[x0 - 1, y0 - 1], [x1 + 1, y0 - 1], [x1 + 1, y1 + 1], [x0 - 1, y1 + 1]]], dtype=np.float64)
+    mapped = cv.perspectiveTransform(corners, matrix)[0]
+    dst_x0 = max(0, int(np.floor(mapped[:, 0].min())) - 1)
+    dst_y0 = max(0, int(np.floor(mapped[:, 1].min())) - 1)
+    dst_x1 = min(width, int(np.ceil(mapped[:, 0].max())) + 2)
+    dst_y1 = min(height, int(np.ceil(mapped[:, 1].max())) + 2)
+
+    if dst_x1 > dst_x0 and dst_y1 > dst_y0:
+        # Game-space region sampled by the output rectangle (plus the bilinear
+        # margin), so only that part of the game overlay is premultiplied
+        src_height, src_width = game_overlay.shape[:2]
+        src_x0, src_y0, src_x1, src_y1 = 0, 0, src_width, src_height
+        dst_corners = np.array([
+            [dst_x0, dst_y0, 1.0], [dst_x1, dst_y0, 1.0], [dst_x1, dst_y1, 1.0], [dst_x0, dst_y1, 1.0]
+        ])
+        src_corners = dst_corners @ np.linalg.inv(matrix).T
+        # Corners on both sides of the horizon do not bound the region: keep it all
+        if np.all(src_corners[:, 2] > 0) or np.all(src_corners[:, 2] < 0):
+            src_corners = src_corners[:, :2] / src_corners[:, 2:]
+            src_x0 = max(0, int(np.floor(src_corners[:, 0].min())) - 2)
+            src_y0 = max(0, int(np.floor(src_corners[:, 1].min())) - 2)
+            src_x1 = min(src_width, int(np.ceil(src_corners[:, 0].max())) + 2)
+            src_y1 = min(src_height, int(np.ceil(src_corners[:, 1].max())) + 2)
+
+        if src_x1 > src_x0 and src_y1 > src_y0:
+            # Warp only the affected output rectangle from the sampled source region
+            # (same matrix, shifted output origin and source offset)
+            shift = np.array([[1.0, 0.0, -dst_x0], [0.0, 1.0, -dst_y0], [0.0, 0.0, 1.0]])
+            offset = np.array([[1.0, 0.0, src_x0], [0.0, 1.0, src_y0], [0.0, 0.0, 1.0]])
+            overlay_argb[dst_y0:dst_y1, dst_x0:dst_x1] = cv.warpPerspective(
+                premultiply_overlay(game_overlay[src_y0:src_y1, src_x0:src_x1]),
+                shift @ matrix @ offset, (dst_x1 - dst_x0, dst_y1 - dst_y0)
+            )
+        else:
+            # The output rectangle samples nothing inside the game overlay
+            overlay_argb[dst_y0:dst_y1, dst_x0:dst_x1] = 0
+
+    overlay_qimage = QtGui.QImage(
+        overlay_argb.data, width, height, width * 4,
+        QtGui.QImage.Format.Format_ARGB32_Premultiplied
+    )
+    return overlay_argb, overlay_qimage
+
+
+def update_game_overlay_warp(cached: GameOverlayWarp | None, game_overlay: np.ndarray, revision: int | None, matrix: np.ndarray, roi: dict, width: int, height: int, target_size: tuple[int, int] | None = None) -> GameOverlayWarp:
+    """Get the warp of a game overlay, reusing the previous one where possible.
+
+    The previous warp is returned as-is while the overlay revision, matrix, ROI
+    and sizes are unchanged (no revision means always check). With the same
+    mapping, only the game-space region whose pixels changed is warped again.
+
+    Args:
+        cached: Previous warp of this zone's game overlay, or None.
+        game_overlay: Game overlay (numpy BGRA) in game coordinates.
+        revision: Game overlay revision, or None if it is not tracked.
+        matrix: Game to camera (or projector) perspective transformation matrix.
+        roi: Camera (or projector) ROI of the zone.
+        width: Width of the camera frame (or projector).
+        height: Height of the camera frame (or projector).
+        target_size: Optional (width, height) to scale the warp to.
+
+    Returns:
+        The warp of the game overlay (cached if unchanged).
+    """
+    inputs_key = (
+        id(game_overlay), revision, matrix.tobytes(),
+        (roi['min_x'], roi['min_y'], roi['max_x'], roi['max_y']),
+        width, height, target_size
+    )
+    if revision is not None and cached is not None and cached.inputs_key == inputs_key:
+        return cached
+
+    # With the same mapping, only the overlay pixels that actually
+    # changed since the last warp need to be warped again
+    same_mapping = cached is not None and cached.inputs_key[2:] == inputs_key[2:]
+    dirty_rect = (0, 0, game_overlay.shape[1], game_overlay.shape[0])
+    if same_mapping:
+        dirty_rect = get_dirty_rect(cached.game_pixels, game_overlay)
+
+    if dirty_rect is None:
+        # Unchanged pixels (e.g. an overlay without revision): keep the warp
+        cached.inputs_key = inputs_key
+        cached.game_overlay = game_overlay
+        return cached
+
+    # Transparency only depends on the overlay pixels: keep the previous
+    # answer while only the mapping changed (e.g. dragging a vertex)
+    if revision is not None and cached is not None and cached.inputs_key[:2] == inputs_key[:2]:
+        has_content = cached.has_content
+    else:
+        has_content = bool(np.max(game_overlay[:, :, 3]) > 0)
+
+    overlay_argb, overlay_qimage, x, y = None, None, 0, 0
+    if has_content and same_mapping and target_size is None and cached.overlay_argb is not None:
+        overlay_argb, overlay_qimage = rewarp_game_overlay_rect(game_overlay, matrix, cached.overlay_argb, dirty_rect)
+        x, y = cached.x, cached.y
+    elif has_content:
+        overlay_argb, overlay_qimage, x, y = warp_game_overlay(game_overlay, matrix, roi, width, height)
+        if target_size is not None and overlay_argb is not None:
+            overlay_argb, overlay_qimage, x, y = scale_overlay(overlay_argb, x, y, width, height, target_size)
+
+    return GameOverlayWarp(inputs_key, game_overlay, has_content, overlay_argb, overlay_qimage, x, y, game_overlay.copy())
@@ -18,6 +18,8 @@ import numpy as np
 import cv2 as cv
 from PySide6 import QtWidgets, QtGui, QtCore
 
+from .overlay_warp import GameOverlayWarp, premultiply_overlay, update_game_overlay_warp
+
 
 class ProjectorViewport(QtWidgets.QLabel):
     """Viewport widget for displaying projector output.
@@ -58,15 +60,28 @@ class ProjectorViewport(QtWidgets.QLabel):
         self._dragging_vertex: tuple | None = None  # (zone, vertex_idx)
         self._drag_start_pos: tuple[int, int] | None = None
 
+        # Drag moves are coalesced: the latest mouse position is kept and applied
+        # at most once per display frame instead of on every mouse move event.
+        self._pending_drag_pos: tuple[int, int] | None = None
+        self._drag_flush_timer = QtCore.QTimer(self)
+        self._drag_flush_timer.setSingleShot(True)
+        self._drag_flush_timer.setInterval(16)
+        self._drag_flush_timer.timeout.connect(self._flush_drag)
+
+        # Warped game overlays, keyed by zone name
+        self._game_overlay_cache: dict[str, GameOverlayWarp] = {}
+
         # Current refresh rate (fps)
         self._fps = 30
 
-        # Frame update timer
+        # Frame update timer (precise, for evenly spaced refreshes)
         self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
         self._timer.timeout.connect(self._update_display)
 
-        # Enable mouse tracking for interactions
-        self.setMouseTracking(True)
+        # Mouse tracking stays off: moves are only handled while dragging a
+        # vertex (button held), which Qt always delivers
+        self.setMouseTracking(False)
 
         # Generate initial test image
         self._generate_test_image()
@@ -119,11 +134,10 @@ class ProjectorViewport(QtWidgets.QLabel):
                     for overlay_data in overlays_to_composite:
                         overlay, x, y, ov_width, ov_height = overlay_data
 
-                        # Convert BGRA overlay to RGBA for Qt
-                        overlay_rgba = cv.cvtColor(overlay, cv.COLOR_BGRA2RGBA)
+                        overlay_argb = premultiply_overlay(overlay)
                         overlay_qimage = QtGui.QImage(
-                            overlay_rgba.data, ov_width, ov_height, ov_width * 4,
-                            QtGui.QImage.Format.Format_RGBA8888
+                            overlay_argb.data, ov_width, ov_height, ov_width * 4,
+                            QtGui.QImage.Format.Format_ARGB32_Premultiplied
                         )
 
                         # Draw overlay at position
@@ -135,6 +149,10 @@ class ProjectorViewport(QtWidgets.QLabel):
                 if self._main_core is not None:
                     game_overlays_to_composite = []
 
+                    # Rebuild the cache from the entries still in use this frame
+                    previous_game_overlay_cache = self._game_overlay_cache
+                    self._game_overlay_cache = {}
+
                     for zone in zones:
                         # Only process zones with calibrated projector mapping
                         if not zone.projector_mapping or not zone.projector_mapping.is_calibrated:
@@ -145,44 +163,22 @@ class ProjectorViewport(QtWidgets.QLabel):
                         if game_overlay is None:
                             continue
 
-                        # Check if overlay has any non-zero alpha values
-                        if np.max(game_overlay[:, :, 3]) == 0:
-                            continue  # Skip fully transparent overlays
-
                         # Get transformation matrix and ROI
                         matrix = zone.projector_mapping.game_to_projector_matrix
                         roi = zone.projector_mapping.roi
                         if matrix is None or roi is None:
                             continue
 
-                        # Calculate ROI dimensions
-                        roi_width = roi['max_x'] - roi['min_x'] + 1
-                        roi_height = roi['max_y'] - roi['min_y'] + 1
-
-                        # Warp game overlay to projector coordinates
-                        warped_overlay = cv.warpPerspective(
-                            game_overlay,
-                            matrix,
-                            (roi_width, roi_height)
+                        # Only re-warp when the overlay revision, matrix, ROI or resolution changed
+                        revision = self._main_core.get_game_projector_overlay_revision(zone.name)
+                        warp = update_game_overlay_warp(
+                            previous_game_overlay_cache.get(zone.name), game_overlay, revision,
+                            matrix, roi, width, height
                         )
+                        self._game_overlay_cache[zone.name] = warp
 
-                        # Ensure we don't go out of frame bounds
-                        x_start = max(0, roi['min_x'])
-                        y_start = max(0, roi['min_y'])
-                        x_end = min(qimage.width(), roi['max_x'])
-                        y_end = min(qimage.height(), roi['max_y'])
-
-                        # Calculate actual dimensions after bounds checking
-                        actual_width = x_end - x_start
-                        actual_height = y_end - y_start
-
-                        if actual_width <= 0 or actual_height <= 0:
-                            continue
-
-                        # Crop warped overlay if needed
-                        warped_crop = warped_overlay[:actual_height, :actual_width]
-
-                        game_overlays_to_composite.append((warped_crop, x_start, y_start))
+                        if warp.overlay_qimage is not None:
+                            game_overlays_to_composite.append((warp.overlay_qimage, warp.x, warp.y))
 
                     # Use Qt QPainter for fast compositing if we have game overlays
                     if game_overlays_to_composite:
@@ -190,26 +186,21 @@ class ProjectorViewport(QtWidgets.QLabel):
                         painter = QtGui.QPainter(qimage)
                         painter.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_SourceOver)
 
-                        for warped_crop, x_pos, y_pos in game_overlays_to_composite:
-                            ov_height, ov_width = warped_crop.shape[:2]
-
-                            # Convert BGRA overlay to RGBA for Qt
-                            overlay_rgba = cv.cvtColor(warped_crop, cv.COLOR_BGRA2RGBA)
-                            overlay_qimage = QtGui.QImage(
-                                overlay_rgba.data, ov_width, ov_height, ov_width * 4,
-                                QtGui.QImage.Format.Format_RGBA8888
-                            )
-
+                        for overlay_qimage, x_pos, y_pos in game_overlays_to_composite:
                             # Draw overlay at position
                             painter.drawImage(x_pos, y_pos, overlay_qimage)
 
                         painter.end()
+                else:
+                    # No game overlays without a main core: drop the stale warps
+                    self._game_overlay_cache.clear()
 
                 # Display QImage directly (no numpy conversion!)
                 self._display_qimage(qimage)
                 return
 
         # No zones or no zone manager - show test image
+        self._game_overlay_cache.clear()
         self._generate_test_image()
 
     def _display_qimage(self, qimage: QtGui.QImage) -> None:
@@ -218,15 +209,15 @@ class ProjectorViewport(QtWidgets.QLabel):
         Args:
             qimage: QImage to display (BGR format).
         """
-        # Convert BGR QImage to RGB for display
-        rgb_qimage = qimage.convertToFormat(QtGui.QImage.Format.Format_RGB888)
-        self.original_pixmap = QtGui.QPixmap.fromImage(rgb_qimage)
+        # Hand the BGR QImage straight to the pixmap: fromImage converts to the
+        # native pixmap format anyway, so an intermediate RGB888 copy is wasted
+        self.original_pixmap = QtGui.QPixmap.fromImage(qimage)
 
-        # Scale to fit viewport
+        # Scale to fit viewport (fast nearest-neighbor on the live refresh path)
         scaled_pixmap = self.original_pixmap.scaled(
             self.size(),
             QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation
+            QtCore.Qt.TransformationMode.FastTransformation
         )
         self.setPixmap(scaled_pixmap)
 
@@ -236,16 +227,14 @@ class ProjectorViewport(QtWidgets.QLabel):
         Args:
             image: BGR image to display.
         """
-        # Convert to QPixmap
-        rgb_image = cv.cvtColor(image, cv.COLOR_BGR2RGB)
-        h, w, ch = rgb_image.shape
-        bytes_per_line = ch * w
+        # Wrap the BGR image directly (Qt consumes OpenCV channel order natively)
+        h, w = image.shape[:2]
         q_image = QtGui.QImage(
-            rgb_image.data,
+            image.data,
             w,
             h,
-            bytes_per_line,
-            QtGui.QImage.Format.Format_RGB888
+            image.strides[0],
+            QtGui.QImage.Format.Format_BGR888
         )
         self.original_pixmap = QtGui.QPixmap.fromImage(q_image)
 
@@ -388,35 +377,38 @@ class ProjectorViewport(QtWidgets.QLabel):
         Args:
             event: Mouse event.
         """
-        pos = event.position()
-        mouse_x = int(pos.x())
-        mouse_y = int(pos.y())
-
-        # Handle vertex dragging
+        # Handle vertex dragging: keep only the latest position until the next flush
         if self._dragging_vertex is not None:
-            zone, vertex_idx = self._dragging_vertex
+            pos = event.position()
+            self._pending_drag_pos = (int(pos.x()), int(pos.y()))
+            if not self._drag_flush_timer.isActive():
+                self._drag_flush_timer.start()
+            event.accept()
+            return
 
-            # Convert viewport coords to frame coords
-            frame_coords = self._viewport_to_frame_coords(mouse_x, mouse_y)
+        super().mouseMoveEvent(event)
 
-            if frame_coords is not None:
-                frame_x, frame_y = frame_coords
+    def _flush_drag(self) -> None:
+        """Apply the latest pending drag position to the dragged vertex."""
+        if self._dragging_vertex is None or self._pending_drag_pos is None:
+            return
 
-                # Update vertex position
-                vertices = list(zone.projector_mapping.vertices)
-                vertices[vertex_idx] = (frame_x, frame_y)
-                zone.projector_mapping.vertices = vertices
+        mouse_x, mouse_y = self._pending_drag_pos
+        self._pending_drag_pos = None
+        zone, vertex_idx = self._dragging_vertex
 
-                # Invalidate overlay to force regeneration
-                zone.projector_mapping.invalidate_overlay()
+        # Convert viewport coords to frame coords
+        frame_coords = self._viewport_to_frame_coords(mouse_x, mouse_y)
 
-                # Emit signal to update UI
-                self.vertex_updated.emit(zone.name)
+        # Nothing to do while the pointer stays on the vertex's current frame pixel
+        if frame_coords is not None and zone.projector_mapping.vertices[vertex_idx] != frame_coords:
+            frame_x, frame_y = frame_coords
 
-                event.accept()
-                return
+            # Update vertex position and invalidate overlay to force regeneration
+            zone.projector_mapping.update_vertex(vertex_idx, frame_x, frame_y)
 
-        super().mouseMoveEvent(event)
+            # Emit signal to update UI
+            self.vertex_updated.emit(zone.name)
 
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent) -> None:
         """Handle mouse release events for vertex dragging.
@@ -425,7 +417,9 @@ class ProjectorViewport(QtWidgets.QLabel):
             event: Mouse event.
         """
         if event.button() == QtCore.Qt.MouseButton.LeftButton and self._dragging_vertex is not None:
-            # End vertex dragging
+            # Apply the last move before ending vertex dragging
+            self._drag_flush_timer.stop()
+            self._flush_drag()
             self._dragging_vertex = None
             self._drag_start_pos = None
             self.setCursor(QtCore.Qt.CursorShape.ArrowCursor)
@@ -20,12 +20,56 @@ camera feed(s) in the main application window.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Callable
 
 import cv2 as cv
 import numpy as np
 from PySide6 import QtWidgets, QtCore, QtGui
 
+from .constants import OVERLAY_TILE_SIZE, ZOOM_NEAREST_MAGNIFICATION
+from .overlay_warp import GameOverlayWarp, premultiply_overlay, scale_overlay, update_game_overlay_warp
+
+
+@dataclass(slots=True)
+class ZoomState:
+    """Zoom and pan of a single viewport cell.
+
+    Attributes:
+        zoom: Zoom factor (1.0 shows the whole frame).
+        center_x: Normalized horizontal zoom center.
+        center_y: Normalized vertical zoom center.
+        pan_x: Normalized horizontal pan offset added to the center.
+        pan_y: Normalized vertical pan offset added to the center.
+    """
+    zoom: float = 1.0
+    center_x: float = 0.5
+    center_y: float = 0.5
+    pan_x: float = 0.0
+    pan_y: float = 0.0
+
+
+@dataclass(slots=True)
+class ZoneOverlayEntry:
+    """Zone overlay prepared for compositing on a viewport cell.
+
+    Attributes:
+        overlay_data: Overlay tuple returned by the zone it was prepared from.
+        target_size: (width, height) the overlay was scaled for, or None at full resolution.
+        overlay_argb: Premultiplied overlay, or None if there is nothing to draw.
+        overlay_qimage: QImage over overlay_argb, or None if there is nothing to draw.
+        x: Overlay x position in the cell frame.
+        y: Overlay y position in the cell frame.
+        tiles: Areas of the overlay worth compositing (see _get_overlay_tiles).
+    """
+    overlay_data: tuple
+    target_size: tuple[int, int] | None
+    overlay_argb: np.ndarray | None
+    overlay_qimage: QtGui.QImage | None
+    x: int
+    y: int
+    tiles: list[tuple[QtCore.QPoint, QtCore.QRect]]
+
 
 class ViewportWidget(QtWidgets.QLabel):
     """Widget for displaying camera feed viewport.
@@ -47,21 +91,38 @@ class ViewportWidget(QtWidgets.QLabel):
         """
         super().__init__(parent)
 
-        # Set default appearance
-        self.setStyleSheet("background-color: rgb(32, 32, 32); border: 1px solid rgb(128, 128, 128);")
+        # Set default appearance (palette + frame instead of a style sheet, which
+        # would be re-parsed on every polish during layout/resize)
+        self._placeholder_text_color = self.palette().color(QtGui.QPalette.ColorRole.Text)
+        palette = self.palette()
+        palette.setColor(QtGui.QPalette.ColorRole.Window, QtGui.QColor(32, 32, 32))
+        palette.setColor(QtGui.QPalette.ColorRole.WindowText, QtGui.QColor(128, 128, 128))
+        self.setPalette(palette)
+        self.setAutoFillBackground(True)
+        self.setFrameShape(QtWidgets.QFrame.Shape.Box)
+        self.setLineWidth(1)
         self.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.setText("No camera selected")
         self.setMinimumSize(640, 480)
         self.setScaledContents(False)
 
-        # Frame update timer
+        # Placeholder messages pre-rendered once into pixmaps, keyed by text
+        self._placeholder_pixmaps: dict[str, QtGui.QPixmap] = {}
+        self._placeholder_text: str | None = None
+        self._show_placeholder("No camera selected")
+
+        # Frame update timer: the single place that pulls the latest frames and
+        # repaints, so paint rate follows the refresh rate and not the camera rate.
+        # A precise timer keeps ticks evenly spaced instead of drifting within the
+        # default 5% coarse-timer window and beating against the display.
         self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
         self._timer.timeout.connect(self._update_frame)
 
         # Callback to get frames from selected cameras
         self._get_frames_callback: Callable[[], list[np.ndarray]] | None = None
         self._get_camera_ids_callback: Callable[[], list[int]] | None = None
         self._get_camera_names_callback: Callable[[], list[str]] | None = None
+        self._get_frame_generations_callback: Callable[[], list[int]] | None = None
 
         # Zone manager reference for overlay compositing
         self._zone_manager = None
@@ -70,14 +131,33 @@ class ViewportWidget(QtWidgets.QLabel):
         self._main_core = None
 
         # Vertex dragging state
-        self._dragging_vertex: tuple | None = None  # (zone, vertex_idx, camera_name)
+        self._dragging_vertex: tuple | None = None  # (zone, vertex_idx, camera_name, cell_idx)
         self._drag_start_pos: tuple[int, int] | None = None
+        self._drag_frame_shape: tuple | None = None
+
+        # Drag moves are coalesced: the latest mouse position is kept and applied
+        # at most once per display frame instead of on every mouse move event.
+        self._pending_drag_pos: tuple[int, int] | None = None
+        self._last_drag_viewport_pos: tuple[int, int] | None = None
+        self._drag_flush_timer = QtCore.QTimer(self)
+        self._drag_flush_timer.setSingleShot(True)
+        self._drag_flush_timer.setInterval(16)
+        self._drag_flush_timer.timeout.connect(self._flush_drag)
 
         # Current refresh rate (fps)
         self._fps = 30
 
-        # Zoom state per cell: {cell_index: {'zoom': float, 'center_x': float, 'center_y': float, 'pan_x': float, 'pan_y': float}}
-        self._zoom_states: dict[int, dict[str, float]] = {}
+        # Updates requested via start() vs. suspended while hidden/minimized
+        self._is_started = False
+        self._is_suspended = False
+        self._window_handle: QtGui.QWindow | None = None
+
+        # Zoom state per cell: {cell_index: ZoomState}
+        self._zoom_states: dict[int, ZoomState] = {}
+
+        # Viewport-to-frame mapping per cell, dropped whenever the cell's zoom changes:
+        # {cell_index: ((frame_w, frame_h, cell_w, cell_h, cols), (left, top, new_w, new_h, x, y, crop_w, crop_h))}
+        self._cell_transforms: dict[int, tuple[tuple[int, int, int, int, int], tuple[int, int, int, int, int, int, int, int]]] = {}
 
         # Pan state for middle mouse button
         self._is_panning = False
@@ -90,23 +170,56 @@ class ViewportWidget(QtWidgets.QLabel):
         self._cell_width = 0
         self._cell_height = 0
 
+        # Persistent buffer the grid is composed into (reallocated on resize)
+        self._composed_qimage: QtGui.QImage | None = None
+
+        # Persistent per-cell buffers frames are scaled or copied into before
+        # overlays are composited: {cell_index: ndarray}
+        self._cell_buffers: dict[int, np.ndarray] = {}
+
+        # Composited cells reused while their frame and overlays are unchanged:
+        # {cell_index: ((camera_name, frame_generation, target_size, crop_rect), overlay_qimages, qimage, frame)}
+        self._cell_results: dict[int, tuple] = {}
+
+        # Inputs of the displayed grid, to skip composing an identical one:
+        # ((width, height, zoom_states), cell_qimages)
+        self._last_compose_inputs: tuple | None = None
+
+        # Last fit-to-cell layout per cell: {cell_index: ((w, h, cell_w, cell_h), (new_w, new_h, x_offset, y_offset))}
+        self._cell_layouts: dict[int, tuple[tuple[int, int, int, int], tuple[int, int, int, int]]] = {}
+
         # Track selected camera identities to detect selection changes
         self._last_camera_ids: list[int] = []
 
-        # Enable mouse tracking for wheel events
-        self.setMouseTracking(True)
+        # Zone overlays premultiplied for Qt (and scaled to the cell if needed),
+        # keyed by (camera_name, zone_name)
+        self._overlay_argb_cache: dict[tuple[str, str], ZoneOverlayEntry] = {}
 
-    def set_get_frames_callback(self, callback: Callable[[], list[np.ndarray]], get_camera_ids_callback: Callable[[], list[int]] | None = None, get_camera_names_callback: Callable[[], list[str]] | None = None) -> None:
+        # Warped game overlays, keyed by (camera_name, zone_name)
+        self._game_overlay_cache: dict[tuple[str, str], GameOverlayWarp] = {}
+
+        # Stable overlays of a camera merged into one image, keyed by camera_name:
+        # {camera_name: (overlay_qimages, atlas_qimage, tiles)}
+        self._overlay_atlas_cache: dict[str, tuple] = {}
+
+        # Mouse tracking stays off: wheel events do not need it, and moves are
+        # only handled while a button is held (drag/pan), which Qt always delivers
+        self.setMouseTracking(False)
+
+    def set_get_frames_callback(self, callback: Callable[[], list[np.ndarray]], get_camera_ids_callback: Callable[[], list[int]] | None = None, get_camera_names_callback: Callable[[], list[str]] | None = None, get_frame_generations_callback: Callable[[], list[int]] | None = None) -> None:
         """Set the callback function to get frames from selected cameras.
 
         Args:
             callback: Function that returns list of frames from selected cameras.
             get_camera_ids_callback: Optional function that returns list of camera IDs for selection tracking.
             get_camera_names_callback: Optional function that returns list of camera names for zone overlay.
+            get_frame_generations_callback: Optional function that returns the frame generation of each
+                selected camera, used to skip redrawing cells whose camera has no new frame.
         """
         self._get_frames_callback = callback
         self._get_camera_ids_callback = get_camera_ids_callback
         self._get_camera_names_callback = get_camera_names_callback
+        self._get_frame_generations_callback = get_frame_generations_callback
 
     def set_zone_manager(self, zone_manager) -> None:
         """Set the zone manager for overlay compositing.
@@ -136,16 +249,69 @@ class ViewportWidget(QtWidgets.QLabel):
 
     def start(self) -> None:
         """Start the viewport frame updates."""
-        if not self._timer.isActive():
+        self._is_started = True
+        if not self._is_suspended and not self._timer.isActive():
             self._timer.start(int(1000 / self._fps))
 
     def stop(self) -> None:
         """Stop the viewport frame updates."""
+        self._is_started = False
+        self._timer.stop()
+
+    def _suspend(self) -> None:
+        """Pause frame updates while the viewport cannot be seen."""
+        self._is_suspended = True
         self._timer.stop()
 
+    def _resume(self) -> None:
+        """Resume frame updates if they were started before being suspended."""
+        self._is_suspended = False
+        if self._is_started and not self._timer.isActive():
+            self._timer.start(int(1000 / self._fps))
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        """Resume frame updates when the viewport becomes visible.
+
+        Args:
+            event: Show event.
+        """
+        super().showEvent(event)
+
+        # Track window minimize/restore (top-level handle only exists once shown)
+        window_handle = self.window().windowHandle()
+        if window_handle is not None and window_handle is not self._window_handle:
+            if self._window_handle is not None:
+                self._window_handle.visibilityChanged.disconnect(self._on_window_visibility_changed)
+            window_handle.visibilityChanged.connect(self._on_window_visibility_changed)
+            self._window_handle = window_handle
+
+        self._resume()
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        """Suspend frame updates while the viewport is hidden.
+
+        Args:
+            event: Hide event.
+        """
+        super().hideEvent(event)
+        self._suspend()
+
+    @QtCore.Slot(QtGui.QWindow.Visibility)
+    def _on_window_visibility_changed(self, visibility: QtGui.QWindow.Visibility) -> None:
+        """Suspend frame updates while the containing window is minimized or hidden.
+
+        Args:
+            visibility: New visibility of the top-level window.
+        """
+        if visibility in (QtGui.QWindow.Visibility.Hidden, QtGui.QWindow.Visibility.Minimized):
+            self._suspend()
+        elif self.isVisible():
+            self._resume()
+
     def reset_zoom(self) -> None:
         """Reset all zoom states."""
         self._zoom_states.clear()
+        self._cell_transforms.clear()
 
     @QtCore.Slot()
     def _update_frame(self) -> None:
@@ -153,13 +319,17 @@ class ViewportWidget(QtWidgets.QLabel):
         if self._get_frames_callback is None:
             return
 
+        # Nothing to draw while the viewport is shown but entirely covered or
+        # clipped (e.g. behind a docked widget); the next tick catches up
+        if self.visibleRegion().isEmpty():
+            return
+
         # Get frames from selected cameras
         frames = self._get_frames_callback()
 
         if not frames:
             # No cameras selected
-            self.clear()
-            self.setText("No camera selected")
+            self._show_placeholder("No camera selected")
             return
 
         # Filter out None frames
@@ -167,8 +337,7 @@ class ViewportWidget(QtWidgets.QLabel):
 
         if not valid_frames:
             # No valid frames available yet
-            self.clear()
-            self.setText("Waiting for camera feed...")
+            self._show_placeholder("Waiting for camera feed...")
             return
 
         # Check if camera selection changed (by IDs, not just count)
@@ -180,8 +349,39 @@ class ViewportWidget(QtWidgets.QLabel):
             self.reset_zoom()
             self._last_camera_ids = current_camera_ids.copy()
 
+        # Cells that are downscaled for display are composited directly at their
+        # display size; zoomed cells keep full resolution to show camera detail
+        _, _, cell_width, cell_height = self._get_grid_layout(len(valid_frames))
+        target_sizes = []
+        for cell_idx, frame in enumerate(valid_frames):
+            target_size = None
+            if cell_idx not in self._zoom_states:
+                height, width = frame.shape[:2]
+                new_w, new_h, _, _ = self._get_cell_layout(cell_idx, width, height, cell_width, cell_height)
+                if new_w < width and new_h < height:
+                    target_size = (new_w, new_h)
+            target_sizes.append(target_size)
+
+        # Frame generations identify cells whose camera has no new frame
+        generations = None
+        if self._get_frame_generations_callback is not None and len(valid_frames) == len(frames):
+            generations = self._get_frame_generations_callback()
+
         # Composite zone overlays on frames (returns QImages)
-        qimages_with_overlays = self._composite_zone_overlays(valid_frames)
+        qimages_with_overlays = self._composite_zone_overlays(valid_frames, target_sizes, generations)
+
+        # Nothing to redraw when every cell was reused and the view is unchanged
+        # (e.g. cameras delivering fewer frames than the refresh rate)
+        compose_key = (
+            self.width(), self.height(),
+            tuple((idx, zs.zoom, zs.center_x, zs.center_y, zs.pan_x, zs.pan_y) for idx, zs in self._zoom_states.items())
+        )
+        last_inputs = self._last_compose_inputs
+        if (self._placeholder_text is None and last_inputs is not None and last_inputs[0] == compose_key and
+                len(last_inputs[1]) == len(qimages_with_overlays) and
+                all(a is b for a, b in zip(last_inputs[1], qimages_with_overlays))):
+            return
+        self._last_compose_inputs = (compose_key, qimages_with_overlays)
 
         # Compose QImages into grid (returns QImage)
         composed_qimage = self._compose_frames(qimages_with_overlays)
@@ -189,95 +389,124 @@ class ViewportWidget(QtWidgets.QLabel):
         # Display QImage directly (no conversion!)
         self._display_qimage(composed_qimage)
 
-    def _composite_zone_overlays(self, frames: list[np.ndarray]) -> list[QtGui.QImage]:
+    def _show_placeholder(self, text: str) -> None:
+        """Display a placeholder message instead of camera frames.
+
+        The message is rendered once into a pixmap and only re-set when the
+        displayed placeholder changes, keeping it off the per-frame path.
+
+        Args:
+            text: Placeholder message to display.
+        """
+        if self._placeholder_text == text:
+            return
+
+        pixmap = self._placeholder_pixmaps.get(text)
+        if pixmap is None:
+            padding = 8
+            text_rect = self.fontMetrics().boundingRect(text)
+            pixmap = QtGui.QPixmap(text_rect.width() + 2 * padding, text_rect.height() + 2 * padding)
+            pixmap.fill(QtGui.QColor(32, 32, 32))
+
+            painter = QtGui.QPainter(pixmap)
+            painter.setFont(self.font())
+            painter.setPen(self._placeholder_text_color)
+            painter.drawText(pixmap.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, text)
+            painter.end()
+
+            self._placeholder_pixmaps[text] = pixmap
+
+        self._placeholder_text = text
+        self.setPixmap(pixmap)
+
+    def _composite_zone_overlays(self, frames: list[np.ndarray], target_sizes: list[tuple[int, int] | None] | None = None, generations: list[int] | None = None) -> list[QtGui.QImage]:
         """Composite zone overlays on camera frames.
 
         Args:
             frames: List of camera frames (numpy BGR).
+            target_sizes: Optional (width, height) per frame to scale the frame to
+                before compositing, or None to composite at full resolution.
+            generations: Optional frame generation per frame; a cell whose frame
+                generation and overlays are unchanged returns the previous QImage.
 
         Returns:
             List of QImages with zone overlays composited.
         """
+        if target_sizes is None:
+            target_sizes = [None] * len(frames)
+
         if self._zone_manager is None or self._get_camera_names_callback is None:
             # No zone manager - just convert frames to QImages
-            result = []
-            for frame in frames:
-                height, width = frame.shape[:2]
-                qimage = QtGui.QImage(frame.data, width, height, width * 3, QtGui.QImage.Format.Format_BGR888).copy()
-                result.append(qimage)
-            return result
+            return [self._frame_to_qimage(frame, target_size, cell_idx) for cell_idx, (frame, target_size) in enumerate(zip(frames, target_sizes))]
 
         # Get camera names
         camera_names = self._get_camera_names_callback()
         if len(camera_names) != len(frames):
             # Mismatch - just convert frames to QImages
-            result = []
-            for frame in frames:
-                height, width = frame.shape[:2]
-                qimage = QtGui.QImage(frame.data, width, height, width * 3, QtGui.QImage.Format.Format_BGR888).copy()
-                result.append(qimage)
-            return result
+            return [self._frame_to_qimage(frame, target_size, cell_idx) for cell_idx, (frame, target_size) in enumerate(zip(frames, target_sizes))]
+
+        # Rebuild the overlay caches from the entries still in use this frame
+        previous_overlay_cache = self._overlay_argb_cache
+        self._overlay_argb_cache = {}
+        previous_game_overlay_cache = self._game_overlay_cache
+        self._game_overlay_cache = {}
+        previous_atlas_cache = self._overlay_atlas_cache
+        self._overlay_atlas_cache = {}
+        previous_cell_results = self._cell_results
+        self._cell_results = {}
+        if generations is not None and len(generations) != len(frames):
+            generations = None
 
         result_frames = []
-        for frame, camera_name in zip(frames, camera_names):
+        for cell_idx, (frame, camera_name, target_size) in enumerate(zip(frames, camera_names, target_sizes)):
             # Get zones with camera mapping for this camera
             zones = self._zone_manager.get_zones_with_camera_mapping(camera_name)
 
-            if not zones:
-                # No zones - convert frame to QImage
-                height, width = frame.shape[:2]
-                qimage = QtGui.QImage(frame.data, width, height, width * 3, QtGui.QImage.Format.Format_BGR888).copy()
-                result_frames.append(qimage)
-                continue
+            # Game overlays without a revision are re-warped every frame, which is
+            # cheaper at full resolution than warping and area-scaling each time
+            if target_size is not None and self._has_unrevisioned_game_overlay(zones):
+                target_size = None
 
-            # Collect overlays first to avoid unnecessary frame copy
-            overlays_to_composite = []
-            for zone in zones:
-                overlay_data = zone.get_camera_overlay(frame.shape)
-                if overlay_data is not None:
-                    overlays_to_composite.append(overlay_data)
-
-            # Only copy frame if we have overlays to composite
-            if overlays_to_composite:
-                # Use Qt QPainter for fast compositing (22x faster than NumPy)
-                height, width = frame.shape[:2]
-
-                # Convert frame to QImage
-                qimage = QtGui.QImage(frame.data, width, height, width * 3, QtGui.QImage.Format.Format_BGR888).copy()
-
-                # Create painter
-                painter = QtGui.QPainter(qimage)
-                painter.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_SourceOver)
+            height, width = frame.shape[:2]
 
-                for overlay_data in overlays_to_composite:
-                    # Unpack ROI overlay data
-                    overlay, x, y, ov_width, ov_height = overlay_data
+            # Overlays to composite, in drawing order: (overlay_qimage, tiles, stable),
+            # where stable overlays are reused as-is on the next frame
+            layers = []
 
-                    # Convert BGRA overlay to RGBA for Qt
-                    overlay_rgba = cv.cvtColor(overlay, cv.COLOR_BGRA2RGBA)
-                    overlay_qimage = QtGui.QImage(
-                        overlay_rgba.data, ov_width, ov_height, ov_width * 4,
-                        QtGui.QImage.Format.Format_RGBA8888
+            for zone in zones:
+                overlay_data = zone.get_camera_overlay(frame.shape)
+                if overlay_data is None:
+                    continue
+
+                # Unpack ROI overlay data
+                overlay, x, y, ov_width, ov_height = overlay_data
+
+                # Zones return the same overlay tuple until it is regenerated,
+                # so only premultiply it for Qt when it (or the scale) changed
+                cache_key = (camera_name, zone.name)
+                cached = previous_overlay_cache.get(cache_key)
+                if cached is None or cached.overlay_data is not overlay_data or cached.target_size != target_size:
+                    overlay_argb = premultiply_overlay(overlay)
+                    if target_size is None:
+                        overlay_qimage = QtGui.QImage(
+                            overlay_argb.data, ov_width, ov_height, ov_width * 4,
+                            QtGui.QImage.Format.Format_ARGB32_Premultiplied
+                        )
+                    else:
+                        overlay_argb, overlay_qimage, x, y = scale_overlay(
+                            overlay_argb, x, y, width, height, target_size
+                        )
+                    cached = ZoneOverlayEntry(
+                        overlay_data, target_size, overlay_argb, overlay_qimage, x, y,
+                        self._get_overlay_tiles(overlay_argb, x, y)
                     )
+                self._overlay_argb_cache[cache_key] = cached
 
-                    # Draw overlay at position
-                    painter.drawImage(x, y, overlay_qimage)
-
-                painter.end()
-
-                # Keep as QImage (no numpy conversion!)
-                result_frames.append(qimage)
-            else:
-                # Convert frame to QImage
-                height, width = frame.shape[:2]
-                qimage = QtGui.QImage(frame.data, width, height, width * 3, QtGui.QImage.Format.Format_BGR888).copy()
-                result_frames.append(qimage)
+                if cached.tiles:
+                    layers.append((cached.overlay_qimage, cached.tiles, True))
 
             # Composite game overlays after zone overlays
             if self._main_core is not None:
-                qimage_with_game = result_frames[-1]
-                game_overlays_to_composite = []
-
                 for zone in zones:
                     # Only process zones with calibrated camera mapping
                     if not zone.camera_mapping or not zone.camera_mapping.is_calibrated:
@@ -288,208 +517,365 @@ class ViewportWidget(QtWidgets.QLabel):
                     if game_overlay is None:
                         continue
 
-                    # Check if overlay has any non-zero alpha values
-                    if np.max(game_overlay[:, :, 3]) == 0:
-                        continue  # Skip fully transparent overlays
-
                     # Get transformation matrix and ROI
                     matrix = zone.camera_mapping.game_to_camera_matrix
                     roi = zone.camera_mapping.roi
                     if matrix is None or roi is None:
                         continue
 
-                    # Calculate ROI dimensions
-                    roi_width = roi['max_x'] - roi['min_x'] + 1
-                    roi_height = roi['max_y'] - roi['min_y'] + 1
-
-                    # Warp game overlay to camera coordinates
-                    warped_overlay = cv.warpPerspective(
-                        game_overlay,
-                        matrix,
-                        (roi_width, roi_height)
+                    # Reuse the previous warp while the game overlay revision, matrix,
+                    # ROI and frame/target size are unchanged (no revision means always warp)
+                    revision = self._main_core.get_game_camera_overlay_revision(zone.name)
+                    cache_key = (camera_name, zone.name)
+                    warp = update_game_overlay_warp(
+                        previous_game_overlay_cache.get(cache_key), game_overlay, revision,
+                        matrix, roi, width, height, target_size
                     )
+                    if warp.tiles is None:
+                        warp.tiles = self._get_overlay_tiles(warp.overlay_argb, warp.x, warp.y)
+                    self._game_overlay_cache[cache_key] = warp
+
+                    if warp.tiles:
+                        layers.append((warp.overlay_qimage, warp.tiles, revision is not None))
+
+            # Merge the leading stable overlays (drawing order is kept) into one
+            # cached atlas, so they are blended onto the frame in a single pass
+            stable_count = 0
+            while stable_count < len(layers) and layers[stable_count][2]:
+                stable_count += 1
+            all_stable = stable_count == len(layers)
+            if stable_count > 1:
+                layers[:stable_count] = [self._get_overlay_atlas(camera_name, layers[:stable_count], previous_atlas_cache)]
+
+            # A zoomed cell only shows its crop rectangle, so overlay tiles
+            # outside of it are not painted (the result depends on the zoom)
+            crop_rect = None
+            if target_size is None and layers and cell_idx in self._zoom_states:
+                crop_rect = self._get_zoom_crop_rect(width, height, self._zoom_states[cell_idx])
+
+            # Reuse the previous result while the camera has no new frame and all
+            # overlays are the same stable images (nothing to scale or paint)
+            cell_key = None
+            overlay_qimages = [layer[0] for layer in layers]
+            if generations is not None and all_stable:
+                cell_key = (camera_name, generations[cell_idx], target_size, crop_rect)
+                cached = previous_cell_results.get(cell_idx)
+                if (cached is not None and cached[0] == cell_key and len(cached[1]) == len(overlay_qimages) and
+                        all(a is b for a, b in zip(cached[1], overlay_qimages))):
+                    self._cell_results[cell_idx] = cached
+                    result_frames.append(cached[2])
+                    continue
+
+            if crop_rect is not None:
+                visible_rect = QtCore.QRect(*crop_rect)
+                visible_layers = []
+                for overlay_qimage, overlay_tiles, stable in layers:
+                    visible_tiles = [
+                        (target, source) for target, source in overlay_tiles
+                        if visible_rect.intersects(QtCore.QRect(target, source.size()))
+                    ]
+                    if visible_tiles:
+                        visible_layers.append((overlay_qimage, visible_tiles, stable))
+                layers = visible_layers
+
+            # Convert frame to QImage (scaled to its display size if requested).
+            # At full resolution it still shares the camera's pixels, so it is only
+            # copied (into the cell's buffer) once an overlay is actually painted on it
+            qimage = self._frame_to_qimage(frame, target_size, cell_idx, writable=bool(layers))
+            if layers:
+                # Use Qt QPainter for fast compositing (22x faster than NumPy)
+                painter = QtGui.QPainter(qimage)
+                painter.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_SourceOver)
 
-                    # Ensure we don't go out of frame bounds
-                    x_start = max(0, roi['min_x'])
-                    y_start = max(0, roi['min_y'])
-                    x_end = min(qimage_with_game.width(), roi['max_x'])
-                    y_end = min(qimage_with_game.height(), roi['max_y'])
+                for overlay_qimage, overlay_tiles, _ in layers:
+                    # Draw only the overlay tiles that are not fully transparent
+                    self._draw_overlay_tiles(painter, overlay_qimage, overlay_tiles)
 
-                    # Calculate actual dimensions after bounds checking
-                    actual_width = x_end - x_start
-                    actual_height = y_end - y_start
+                painter.end()
 
-                    if actual_width <= 0 or actual_height <= 0:
-                        continue
+            result_frames.append(qimage)
+            if cell_key is not None:
+                self._cell_results[cell_idx] = (cell_key, overlay_qimages, qimage, frame)
 
-                    # Crop warped overlay if needed
-                    warped_crop = warped_overlay[:actual_height, :actual_width]
+        return result_frames
 
-                    game_overlays_to_composite.append((warped_crop, x_start, y_start))
+    def _get_overlay_atlas(self, camera_name: str, layers: list[tuple], previous_atlas_cache: dict[str, tuple]) -> tuple:
+        """Get the overlays of a camera merged into a single premultiplied image.
 
-                # Use Qt QPainter for fast compositing if we have game overlays
-                if game_overlays_to_composite:
-                    # Create painter on existing QImage
-                    painter = QtGui.QPainter(qimage_with_game)
-                    painter.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_SourceOver)
+        The atlas is only redrawn when one of the overlays was rebuilt.
 
-                    for warped_crop, x_pos, y_pos in game_overlays_to_composite:
-                        ov_height, ov_width = warped_crop.shape[:2]
+        Args:
+            camera_name: Name of the camera.
+            layers: Overlays in drawing order, as (overlay_qimage, tiles, stable).
+            previous_atlas_cache: Atlas cache of the previous frame.
 
-                        # Convert BGRA overlay to RGBA for Qt
-                        overlay_rgba = cv.cvtColor(warped_crop, cv.COLOR_BGRA2RGBA)
-                        overlay_qimage = QtGui.QImage(
-                            overlay_rgba.data, ov_width, ov_height, ov_width * 4,
-                            QtGui.QImage.Format.Format_RGBA8888
-                        )
+        Returns:
+            The atlas as an (overlay_qimage, tiles, stable) layer.
+        """
+        overlay_qimages = tuple(layer[0] for layer in layers)
+        cached = previous_atlas_cache.get(camera_name)
+        if (cached is None or len(cached[0]) != len(overlay_qimages) or
+                any(previous is not current for previous, current in zip(cached[0], overlay_qimages))):
+            # Bounds of all visible tiles
+            bounds = QtCore.QRect()
+            for _, tiles, _ in layers:
+                for target, source in tiles:
+                    bounds = bounds.united(QtCore.QRect(target, source.size()))
+
+            atlas_qimage = QtGui.QImage(bounds.size(), QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+            atlas_qimage.fill(QtCore.Qt.GlobalColor.transparent)
+            painter = QtGui.QPainter(atlas_qimage)
+            painter.translate(-bounds.x(), -bounds.y())
+            for overlay_qimage, tiles, _ in layers:
+                self._draw_overlay_tiles(painter, overlay_qimage, tiles)
+            painter.end()
 
-                        # Draw overlay at position
-                        painter.drawImage(x_pos, y_pos, overlay_qimage)
+            # Premultiplied ARGB32 is BGRA in memory (little-endian), alpha last
+            atlas_argb = np.frombuffer(atlas_qimage.constBits(), dtype=np.uint8).reshape(
+                bounds.height(), atlas_qimage.bytesPerLine() // 4, 4
+            )[:, :bounds.width()]
+            cached = (overlay_qimages, atlas_qimage, self._get_overlay_tiles(atlas_argb, bounds.x(), bounds.y()))
+        self._overlay_atlas_cache[camera_name] = cached
 
-                    painter.end()
+        return cached[1], cached[2], True
 
-                    # Keep as QImage (no numpy conversion!)
+    @staticmethod
+    def _draw_overlay_tiles(painter: QtGui.QPainter, overlay_qimage: QtGui.QImage, tiles: list[tuple[QtCore.QPoint, QtCore.QRect]]) -> None:
+        """Draw the given tiles of an overlay.
 
-        return result_frames
+        The overlay is drawn with a single call clipped to the tiles rather than
+        one call per tile: every void QPainter call through PySide6 6.12 drops a
+        reference to None, which aborts long sessions once it reaches zero. The
+        clip is left set, so end the painter (or set a new clip) afterwards.
 
-    def _compose_frames(self, frames: list[QtGui.QImage]) -> QtGui.QImage:
-        """Compose multiple QImages into a single grid layout.
+        Args:
+            painter: Active painter.
+            overlay_qimage: Overlay to draw.
+            tiles: (target, source) pairs from _get_overlay_tiles, all of the same overlay.
+        """
+        if not tiles:
+            return
+
+        region = QtGui.QRegion()
+        for target, source in tiles:
+            region += QtCore.QRect(target, source.size())
+
+        # All tiles share the overlay's position in the frame
+        target, source = tiles[0]
+        painter.setClipRegion(region)
+        painter.drawImage(target - source.topLeft(), overlay_qimage)
+
+    def _has_unrevisioned_game_overlay(self, zones: list) -> bool:
+        """Check if any calibrated zone has a game overlay without a revision.
 
         Args:
-            frames: List of QImages to compose.
+            zones: Zones mapped to a camera.
 
         Returns:
-            Composed frame as QImage.
+            True if a game camera overlay of these zones cannot be cached.
         """
-        num_frames = len(frames)
+        if self._main_core is None:
+            return False
 
-        if num_frames == 1:
-            # Single camera - full viewport, but still apply zoom/pan
-            viewport_width = self.width()
-            viewport_height = self.height()
-            cell_width = viewport_width
-            cell_height = viewport_height
-            rows = 1
-            cols = 1
-
-            # Process single frame with zoom/pan on FULL RESOLUTION first
-            qimage = frames[0]
-
-            # Apply zoom/pan on full resolution if set
-            if 0 in self._zoom_states:
-                qimage = self._apply_zoom_pan_qimage(qimage, self._zoom_states[0])
-
-            # Now scale to fit viewport
-            w = qimage.width()
-            h = qimage.height()
-            aspect = w / h
-            cell_aspect = cell_width / cell_height
-
-            if aspect > cell_aspect:
-                new_w = cell_width
-                new_h = int(cell_width / aspect)
-            else:
-                new_h = cell_height
-                new_w = int(cell_height * aspect)
+        for zone in zones:
+            if not zone.camera_mapping or not zone.camera_mapping.is_calibrated:
+                continue
+            if (self._main_core.get_game_camera_overlay_revision(zone.name) is None and
+                    self._main_core.get_game_camera_overlay(zone.name) is not None):
+                return True
+        return False
 
-            # Scale QImage
-            resized = qimage.scaled(new_w, new_h, QtCore.Qt.AspectRatioMode.IgnoreAspectRatio, QtCore.Qt.TransformationMode.SmoothTransformation)
+    def _frame_to_qimage(self, frame: np.ndarray, target_size: tuple[int, int] | None, cell_idx: int, writable: bool = False) -> QtGui.QImage:
+        """Convert a camera frame to a QImage that can be painted on.
 
-            # Create cell with black padding using QPainter
-            cell = QtGui.QImage(cell_width, cell_height, QtGui.QImage.Format.Format_BGR888)
-            cell.fill(QtCore.Qt.GlobalColor.black)
+        Args:
+            frame: Camera frame (numpy BGR).
+            target_size: Optional (width, height) to scale the frame to.
+            cell_idx: Cell index, selecting the buffer the frame is written to.
+            writable: Whether the QImage will be painted on. Without target_size,
+                the frame is then copied into the cell's buffer.
 
-            painter = QtGui.QPainter(cell)
-            y_offset = (cell_height - new_h) // 2
-            x_offset = (cell_width - new_w) // 2
-            painter.drawImage(x_offset, y_offset, resized)
-            painter.end()
+        Returns:
+            BGR QImage. If it shares the cell's buffer, it is only valid until the
+            next frame; otherwise it shares the frame's pixels and is read-only.
+        """
+        height, width = frame.shape[:2]
+        if target_size is None:
+            if not writable:
+                return QtGui.QImage(frame.data, width, height, width * 3, QtGui.QImage.Format.Format_BGR888)
+            buffer = self._get_cell_buffer(cell_idx, width, height)
+            np.copyto(buffer, frame)
+            return QtGui.QImage(buffer.data, width, height, width * 3, QtGui.QImage.Format.Format_BGR888)
+
+        # Scale into the cell's persistent buffer
+        new_w, new_h = target_size
+        buffer = self._get_cell_buffer(cell_idx, new_w, new_h)
+        self._resize_into(frame, buffer)
+        return QtGui.QImage(buffer.data, new_w, new_h, new_w * 3, QtGui.QImage.Format.Format_BGR888)
+
+    def _get_cell_buffer(self, cell_idx: int, width: int, height: int) -> np.ndarray:
+        """Get the persistent BGR buffer of a cell, reallocated on size change only.
 
-            # Store layout info
-            self._current_rows = rows
-            self._current_cols = cols
-            self._cell_width = cell_width
-            self._cell_height = cell_height
+        Args:
+            cell_idx: Cell index.
+            width: Buffer width.
+            height: Buffer height.
 
-            return cell
+        Returns:
+            Buffer of shape (height, width, 3), with undefined content.
+        """
+        buffer = self._cell_buffers.get(cell_idx)
+        if buffer is None or buffer.shape[0] != height or buffer.shape[1] != width:
+            buffer = np.empty((height, width, 3), dtype=np.uint8)
+            self._cell_buffers[cell_idx] = buffer
+        return buffer
 
-        # Determine grid layout based on number of frames
-        # 2 cameras: side by side (1x2)
-        # 3-4 cameras: 2x2 grid
+    @staticmethod
+    def _resize_into(source: np.ndarray, dst: np.ndarray) -> None:
+        """Resize an image into a preallocated buffer.
 
-        # Get viewport dimensions
-        viewport_width = self.width()
-        viewport_height = self.height()
+        Bilinear resizing aliases past 2x downscale, so larger downscales first
+        average 2x2 blocks (area interpolation at an exact factor of 2, which
+        OpenCV vectorizes) until the image is within 2x of the target.
 
-        if num_frames == 2:
-            # Side by side
-            cell_width = viewport_width // 2
-            cell_height = viewport_height
-            rows = 1
-            cols = 2
-        else:
-            # 2x2 grid for 3-4 cameras
-            cell_width = viewport_width // 2
-            cell_height = viewport_height // 2
-            rows = 2
-            cols = 2
-
-        # Resize frames to fit cells
-        resized_frames = []
-        for cell_idx, qimage in enumerate(frames):
-            # Apply zoom/pan on FULL RESOLUTION first if set for this cell
-            if cell_idx in self._zoom_states:
-                qimage = self._apply_zoom_pan_qimage(qimage, self._zoom_states[cell_idx])
+        Args:
+            source: Source image (may be a view).
+            dst: Destination buffer or view, of the target size.
+        """
+        dst_h, dst_w = dst.shape[:2]
+        src_h, src_w = source.shape[:2]
+        while dst_w * 2 < src_w or dst_h * 2 < src_h:
+            # An odd last row/column is dropped to keep the factor exact
+            src_w //= 2
+            src_h //= 2
+            source = cv.resize(source[:src_h * 2, :src_w * 2], (src_w, src_h), interpolation=cv.INTER_AREA)
+        cv.resize(source, (dst_w, dst_h), dst=dst, interpolation=cv.INTER_LINEAR)
+
+    @staticmethod
+    def _get_overlay_tiles(overlay_argb: np.ndarray | None, x: int, y: int) -> list[tuple[QtCore.QPoint, QtCore.QRect]]:
+        """Get the areas of an overlay worth compositing.
+
+        The overlay is split in OVERLAY_TILE_SIZE tiles and fully transparent tiles
+        are dropped, so the empty inside of zone outlines is never blended. Visible
+        tiles are merged into horizontal runs to keep the clip region simple.
 
-            # Calculate aspect-preserving resize
-            w = qimage.width()
-            h = qimage.height()
-            aspect = w / h
-            cell_aspect = cell_width / cell_height
-
-            if aspect > cell_aspect:
-                # Width-limited
-                new_w = cell_width
-                new_h = int(cell_width / aspect)
-            else:
-                # Height-limited
-                new_h = cell_height
-                new_w = int(cell_height * aspect)
+        Args:
+            overlay_argb: Premultiplied overlay, or None if there is nothing to draw.
+            x: Overlay x position in the frame.
+            y: Overlay y position in the frame.
 
-            # Scale QImage
-            resized = qimage.scaled(new_w, new_h, QtCore.Qt.AspectRatioMode.IgnoreAspectRatio, QtCore.Qt.TransformationMode.SmoothTransformation)
+        Returns:
+            List of (target, source) pairs, where target is the frame position and
+            source the overlay rectangle to draw there.
+        """
+        if overlay_argb is None:
+            return []
+
+        tile = OVERLAY_TILE_SIZE
+        height, width = overlay_argb.shape[:2]
+        rows = -(-height // tile)
+        cols = -(-width // tile)
+
+        # Max alpha of each tile (padded with transparent pixels up to whole tiles)
+        alpha = np.zeros((rows * tile, cols * tile), dtype=np.uint8)
+        alpha[:height, :width] = overlay_argb[:, :, 3]
+        visible = alpha.reshape(rows, tile, cols, tile).max(axis=(1, 3)) > 0
+
+        tiles = []
+        for row in np.flatnonzero(visible.any(axis=1)):
+            # Start/end columns of each run of visible tiles in this row
+            edges = np.flatnonzero(np.diff(visible[row], prepend=False, append=False))
+            source_y = int(row) * tile
+            source_height = min(tile, height - source_y)
+            for start, end in zip(edges[::2], edges[1::2]):
+                source_x = int(start) * tile
+                source_width = min(int(end) * tile, width) - source_x
+                tiles.append((
+                    QtCore.QPoint(x + source_x, y + source_y),
+                    QtCore.QRect(source_x, source_y, source_width, source_height)
+                ))
+        return tiles
 
-            # Create cell with black padding using QPainter
-            cell = QtGui.QImage(cell_width, cell_height, QtGui.QImage.Format.Format_BGR888)
-            cell.fill(QtCore.Qt.GlobalColor.black)
+    def _compose_frames(self, frames: list[QtGui.QImage]) -> QtGui.QImage:
+        """Compose multiple QImages into a single grid layout.
 
-            painter = QtGui.QPainter(cell)
-            y_offset = (cell_height - new_h) // 2
-            x_offset = (cell_width - new_w) // 2
-            painter.drawImage(x_offset, y_offset, resized)
-            painter.end()
+        Cells are drawn directly into a persistent viewport-sized buffer, which is
+        only reallocated when the viewport size changes.
 
-            resized_frames.append(cell)
+        Args:
+            frames: List of QImages to compose.
 
-        # Pad with black frames if needed
-        total_cells = rows * cols
-        while len(resized_frames) < total_cells:
-            black_cell = QtGui.QImage(cell_width, cell_height, QtGui.QImage.Format.Format_BGR888)
-            black_cell.fill(QtCore.Qt.GlobalColor.black)
-            resized_frames.append(black_cell)
+        Returns:
+            Composed frame as QImage.
+        """
+        num_frames = len(frames)
 
-        # Compose grid using QPainter
-        composed = QtGui.QImage(viewport_width, viewport_height, QtGui.QImage.Format.Format_BGR888)
-        composed.fill(QtCore.Qt.GlobalColor.black)
+        # Get viewport dimensions
+        viewport_width = self.width()
+        viewport_height = self.height()
+
+        rows, cols, cell_width, cell_height = self._get_grid_layout(num_frames)
+
+        # Every pixel of the buffer is either covered by a frame or explicitly
+        # filled below, so it is not cleared up front
+        composed = self._get_composed_buffer(viewport_width, viewport_height)
+        composed_array = self._qimage_to_array(composed, writable=True)
+        black = QtCore.Qt.GlobalColor.black
 
         painter = QtGui.QPainter(composed)
-        for r in range(rows):
-            for c in range(cols):
-                idx = r * cols + c
-                if idx < len(resized_frames):
-                    x_pos = c * cell_width
-                    y_pos = r * cell_height
-                    painter.drawImage(x_pos, y_pos, resized_frames[idx])
+        for cell_idx, qimage in enumerate(frames):
+            # Zoom/pan crops the FULL RESOLUTION image if set for this cell
+            crop_rect = None
+            source_width = qimage.width()
+            source_height = qimage.height()
+            if cell_idx in self._zoom_states:
+                crop_rect = self._get_zoom_crop_rect(source_width, source_height, self._zoom_states[cell_idx])
+                source_width, source_height = crop_rect[2], crop_rect[3]
+
+            # Calculate aspect-preserving resize
+            new_w, new_h, x_offset, y_offset = self._get_cell_layout(cell_idx, source_width, source_height, cell_width, cell_height)
+
+            # Centered in its cell
+            cell_x = (cell_idx % cols) * cell_width
+            cell_y = (cell_idx // cols) * cell_height
+            target_x = cell_x + x_offset
+            target_y = cell_y + y_offset
+
+            if crop_rect is None and new_w == source_width and new_h == source_height:
+                # Already composited at display size
+                painter.drawImage(target_x, target_y, qimage)
+            else:
+                source_array = self._qimage_to_array(qimage)
+                cell_array = composed_array[target_y:target_y + new_h, target_x:target_x + new_w]
+                if crop_rect is not None:
+                    # Resize straight from a view of the zoomed region (no crop copy)
+                    x1, y1, crop_w, crop_h = crop_rect
+                    source_array = source_array[y1:y1 + crop_h, x1:x1 + crop_w]
+                if crop_rect is not None and new_w > ZOOM_NEAREST_MAGNIFICATION * crop_w:
+                    # Highly magnified: show source pixels as crisp blocks, which
+                    # also reads a single source pixel per output pixel
+                    cv.resize(source_array, (new_w, new_h), dst=cell_array, interpolation=cv.INTER_NEAREST)
+                else:
+                    # Resize straight into the cell's region of the composed buffer
+                    self._resize_into(source_array, cell_array)
+
+            # Fill only the letterbox/pillarbox bars the frame does not cover
+            if new_h < cell_height:
+                painter.fillRect(cell_x, cell_y, cell_width, y_offset, black)
+                painter.fillRect(cell_x, cell_y + y_offset + new_h, cell_width, cell_height - y_offset - new_h, black)
+            if new_w < cell_width:
+                painter.fillRect(cell_x, cell_y + y_offset, x_offset, new_h, black)
+                painter.fillRect(cell_x + x_offset + new_w, cell_y + y_offset, cell_width - x_offset - new_w, new_h, black)
+
+        # Fill unused cells (3 cameras in a 2x2 grid)
+        for cell_idx in range(num_frames, rows * cols):
+            painter.fillRect((cell_idx % cols) * cell_width, (cell_idx // cols) * cell_height, cell_width, cell_height, black)
+
+        # Fill the remainder strips left by odd viewport sizes
+        if cols * cell_width < viewport_width:
+            painter.fillRect(cols * cell_width, 0, viewport_width - cols * cell_width, viewport_height, black)
+        if rows * cell_height < viewport_height:
+            painter.fillRect(0, rows * cell_height, viewport_width, viewport_height - rows * cell_height, black)
         painter.end()
 
         # Store current grid layout for mouse event handling
@@ -500,106 +886,122 @@ class ViewportWidget(QtWidgets.QLabel):
 
         return composed
 
-    def _apply_zoom_pan_qimage(self, qimage: QtGui.QImage, zoom_state: dict[str, float]) -> QtGui.QImage:
-        """Apply zoom and pan to a QImage by extracting ROI.
+    @staticmethod
+    def _qimage_to_array(qimage: QtGui.QImage, writable: bool = False) -> np.ndarray:
+        """Get a zero-copy numpy view of a BGR QImage.
+
+        The view is only valid while the QImage is alive and not reallocated.
 
         Args:
-            qimage: Input QImage.
-            zoom_state: Zoom state dict with zoom, center_x, center_y, pan_x, pan_y.
+            qimage: QImage in Format_BGR888.
+            writable: Whether the view writes through to the QImage pixels.
 
         Returns:
-            Cropped ROI QImage.
+            Array view of shape (height, width, 3).
         """
-        zoom_factor = zoom_state['zoom']
-        center_x = zoom_state['center_x']
-        center_y = zoom_state['center_y']
-        pan_x = zoom_state.get('pan_x', 0.0)
-        pan_y = zoom_state.get('pan_y', 0.0)
+        width = qimage.width()
+        height = qimage.height()
+        buffer = np.frombuffer(qimage.bits() if writable else qimage.constBits(), dtype=np.uint8)
+        return buffer.reshape(height, qimage.bytesPerLine())[:, :width * 3].reshape(height, width, 3)
 
-        w = qimage.width()
-        h = qimage.height()
+    def _get_grid_layout(self, num_frames: int) -> tuple[int, int, int, int]:
+        """Get the grid layout used to display a number of frames.
 
-        # Calculate crop region centered on zoom point with pan offset
-        crop_w = int(w / zoom_factor)
-        crop_h = int(h / zoom_factor)
+        1 camera: full viewport
+        2 cameras: side by side (1x2)
+        3-4 cameras: 2x2 grid
 
-        # Apply pan offset (normalized to image coordinates)
-        center_x_px = center_x * w + pan_x * w
-        center_y_px = center_y * h + pan_y * h
-
-        # Calculate crop coordinates
-        x1 = int(center_x_px - crop_w / 2)
-        y1 = int(center_y_px - crop_h / 2)
+        Args:
+            num_frames: Number of frames to display.
 
-        # Clamp to image bounds
-        x1 = max(0, min(x1, w - crop_w))
-        y1 = max(0, min(y1, h - crop_h))
+        Returns:
+            Tuple of (rows, cols, cell_width, cell_height).
+        """
+        viewport_width = self.width()
+        viewport_height = self.height()
 
-        # Return cropped QImage
-        return qimage.copy(x1, y1, crop_w, crop_h)
+        if num_frames == 1:
+            return 1, 1, viewport_width, viewport_height
+        if num_frames == 2:
+            # Side by side
+            return 1, 2, viewport_width // 2, viewport_height
+        # 2x2 grid for 3-4 cameras
+        return 2, 2, viewport_width // 2, viewport_height // 2
 
-    def _apply_zoom_pan_full_res(self, image: np.ndarray, zoom_state: dict[str, float]) -> np.ndarray:
-        """Apply zoom and pan to a full resolution image by extracting ROI.
+    def _get_composed_buffer(self, width: int, height: int) -> QtGui.QImage:
+        """Get the persistent buffer frames are composed into.
 
-        This method works on the full resolution image and returns the cropped ROI,
-        which should then be scaled to viewport size. This preserves maximum quality.
+        The buffer is reused across frames (QPixmap.fromImage copies it on display)
+        and only reallocated when the requested size changes.
 
         Args:
-            image: Full resolution input image.
-            zoom_state: Zoom state dict with zoom, center_x, center_y, pan_x, pan_y.
+            width: Buffer width.
+            height: Buffer height.
 
         Returns:
-            Cropped ROI from full resolution image.
+            BGR QImage of the requested size, with undefined contents.
         """
-        zoom_factor = zoom_state['zoom']
-        center_x = zoom_state['center_x']
-        center_y = zoom_state['center_y']
-        pan_x = zoom_state.get('pan_x', 0.0)
-        pan_y = zoom_state.get('pan_y', 0.0)
+        if self._composed_qimage is None or self._composed_qimage.width() != width or self._composed_qimage.height() != height:
+            self._composed_qimage = QtGui.QImage(width, height, QtGui.QImage.Format.Format_BGR888)
+        return self._composed_qimage
 
-        h, w = image.shape[:2]
+    def _get_cell_layout(self, cell_idx: int, w: int, h: int, cell_width: int, cell_height: int) -> tuple[int, int, int, int]:
+        """Get the aspect-preserving size and offset of an image inside a cell.
 
-        # Calculate crop region centered on zoom point with pan offset
-        crop_w = int(w / zoom_factor)
-        crop_h = int(h / zoom_factor)
+        The result is memoized per cell, since source and cell sizes only change
+        on resize, selection or zoom changes.
 
-        # Apply pan offset (normalized to image coordinates)
-        center_x_px = center_x * w + pan_x * w
-        center_y_px = center_y * h + pan_y * h
-
-        # Calculate crop coordinates
-        x1 = int(center_x_px - crop_w / 2)
-        y1 = int(center_y_px - crop_h / 2)
-        x2 = x1 + crop_w
-        y2 = y1 + crop_h
+        Args:
+            cell_idx: Index of the cell.
+            w: Source image width.
+            h: Source image height.
+            cell_width: Cell width.
+            cell_height: Cell height.
 
-        # Clamp to image bounds
-        x1 = max(0, min(x1, w - crop_w))
-        y1 = max(0, min(y1, h - crop_h))
-        x2 = x1 + crop_w
-        y2 = y1 + crop_h
+        Returns:
+            Tuple of (new_w, new_h, x_offset, y_offset).
+        """
+        # Images already fitted to the cell (composited at display size) keep their size
+        if (w == cell_width and h <= cell_height) or (h == cell_height and w <= cell_width):
+            return w, h, (cell_width - w) // 2, (cell_height - h) // 2
+
+        key = (w, h, cell_width, cell_height)
+        cached = self._cell_layouts.get(cell_idx)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        aspect = w / h
+        cell_aspect = cell_width / cell_height
+
+        if aspect > cell_aspect:
+            # Width-limited
+            new_w = cell_width
+            new_h = int(cell_width / aspect)
+        else:
+            # Height-limited
+            new_h = cell_height
+            new_w = int(cell_height * aspect)
 
-        # Return cropped ROI at full resolution
-        cropped = image[y1:y2, x1:x2]
-        return cropped
+        layout = (new_w, new_h, (cell_width - new_w) // 2, (cell_height - new_h) // 2)
+        self._cell_layouts[cell_idx] = (key, layout)
+        return layout
 
-    def _apply_zoom_pan(self, image: np.ndarray, zoom_state: dict[str, float]) -> np.ndarray:
-        """Apply zoom and pan to an image (legacy method - resizes back to original size).
+    def _get_zoom_crop_rect(self, w: int, h: int, zoom_state: ZoomState) -> tuple[int, int, int, int]:
+        """Get the region of an image shown by a zoom state.
 
         Args:
-            image: Input image.
-            zoom_state: Zoom state dict with zoom, center_x, center_y, pan_x, pan_y.
+            w: Image width.
+            h: Image height.
+            zoom_state: Zoom state of the cell.
 
         Returns:
-            Transformed image.
+            Tuple of (x, y, width, height) of the region.
         """
-        zoom_factor = zoom_state['zoom']
-        center_x = zoom_state['center_x']
-        center_y = zoom_state['center_y']
-        pan_x = zoom_state.get('pan_x', 0.0)
-        pan_y = zoom_state.get('pan_y', 0.0)
-
-        h, w = image.shape[:2]
+        zoom_factor = zoom_state.zoom
+        center_x = zoom_state.center_x
+        center_y = zoom_state.center_y
+        pan_x = zoom_state.pan_x
+        pan_y = zoom_state.pan_y
 
         # Calculate crop region centered on zoom point with pan offset
         crop_w = int(w / zoom_factor)
@@ -612,20 +1014,12 @@ class ViewportWidget(QtWidgets.QLabel):
         # Calculate crop coordinates
         x1 = int(center_x_px - crop_w / 2)
         y1 = int(center_y_px - crop_h / 2)
-        x2 = x1 + crop_w
-        y2 = y1 + crop_h
 
         # Clamp to image bounds
         x1 = max(0, min(x1, w - crop_w))
         y1 = max(0, min(y1, h - crop_h))
-        x2 = x1 + crop_w
-        y2 = y1 + crop_h
-
-        # Crop and resize back to original size
-        cropped = image[y1:y2, x1:x2]
-        resized = cv.resize(cropped, (w, h), interpolation=cv.INTER_LINEAR)
 
-        return resized
+        return x1, y1, crop_w, crop_h
 
     def _display_qimage(self, qimage: QtGui.QImage) -> None:
         """Display a QImage directly in the viewport (optimized - no conversion).
@@ -633,18 +1027,22 @@ class ViewportWidget(QtWidgets.QLabel):
         Args:
             qimage: QImage to display (BGR format).
         """
-        # Convert BGR QImage to RGB for display
-        rgb_qimage = qimage.convertToFormat(QtGui.QImage.Format.Format_RGB888)
-        pixmap = QtGui.QPixmap.fromImage(rgb_qimage)
-
-        # Scale to fit viewport while maintaining aspect ratio
-        scaled_pixmap = pixmap.scaled(
-            self.size(),
-            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation
-        )
-
-        self.setPixmap(scaled_pixmap)
+        # Hand the BGR QImage straight to the pixmap: fromImage converts to the
+        # native pixmap format anyway, so an intermediate RGB888 copy is wasted
+        pixmap = QtGui.QPixmap.fromImage(qimage)
+
+        # _compose_frames already renders at viewport size; only rescale if the
+        # widget was resized since (fast nearest-neighbor: live video changes
+        # every frame, smoothing is not perceptible)
+        if pixmap.size() != self.size():
+            pixmap = pixmap.scaled(
+                self.size(),
+                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                QtCore.Qt.TransformationMode.FastTransformation
+            )
+
+        self._placeholder_text = None
+        self.setPixmap(pixmap)
 
     def _display_frame(self, frame: np.ndarray) -> None:
         """Display a numpy frame in the viewport (legacy method).
@@ -652,32 +1050,31 @@ class ViewportWidget(QtWidgets.QLabel):
         Args:
             frame: Frame to display (BGR format).
         """
-        # Convert BGR to RGB
-        rgb_frame = cv.cvtColor(frame, cv.COLOR_BGR2RGB)
-
-        h, w, ch = rgb_frame.shape
-        bytes_per_line = ch * w
+        h, w = frame.shape[:2]
 
-        # Create QImage
+        # Wrap the BGR frame directly (Qt consumes OpenCV channel order natively)
         q_image = QtGui.QImage(
-            rgb_frame.data,
+            frame.data,
             w,
             h,
-            bytes_per_line,
-            QtGui.QImage.Format.Format_RGB888
+            frame.strides[0],
+            QtGui.QImage.Format.Format_BGR888
         )
 
         # Convert to QPixmap and display
         pixmap = QtGui.QPixmap.fromImage(q_image)
 
-        # Scale to fit viewport while maintaining aspect ratio
-        scaled_pixmap = pixmap.scaled(
-            self.size(),
-            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation
-        )
+        # Scale to fit viewport while maintaining aspect ratio (skipped when the
+        # frame was already rendered at viewport size)
+        if pixmap.size() != self.size():
+            pixmap = pixmap.scaled(
+                self.size(),
+                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                QtCore.Qt.TransformationMode.SmoothTransformation
+            )
 
-        self.setPixmap(scaled_pixmap)
+        self._placeholder_text = None
+        self.setPixmap(pixmap)
 
     def wheelEvent(self, event: QtGui.QWheelEvent) -> None:
         """Handle mouse wheel events for zooming.
@@ -708,17 +1105,11 @@ class ViewportWidget(QtWidgets.QLabel):
         zoom_delta = 1.1 if delta > 0 else 0.9
 
         # Get or create zoom state for this cell
-        if cell_idx not in self._zoom_states:
-            self._zoom_states[cell_idx] = {
-                'zoom': 1.0,
-                'center_x': 0.5,
-                'center_y': 0.5,
-                'pan_x': 0.0,
-                'pan_y': 0.0
-            }
-
-        zoom_state = self._zoom_states[cell_idx]
-        old_zoom = zoom_state['zoom']
+        zoom_state = self._zoom_states.get(cell_idx)
+        if zoom_state is None:
+            zoom_state = self._zoom_states[cell_idx] = ZoomState()
+
+        old_zoom = zoom_state.zoom
         new_zoom = old_zoom * zoom_delta
 
         # Clamp zoom to minimum 1.0 (100%)
@@ -766,8 +1157,8 @@ class ViewportWidget(QtWidgets.QLabel):
         # The pixel under the mouse in the current view should stay under the mouse after zoom
         if old_zoom != new_zoom and old_zoom > 0:
             # Current center with pan
-            old_center_x = zoom_state['center_x'] + zoom_state['pan_x']
-            old_center_y = zoom_state['center_y'] + zoom_state['pan_y']
+            old_center_x = zoom_state.center_x + zoom_state.pan_x
+            old_center_y = zoom_state.center_y + zoom_state.pan_y
 
             # Calculate the image coordinate of the pixel under the mouse
             # In the current zoomed view, the mouse is at rel_x, rel_y in the cell
@@ -789,13 +1180,14 @@ class ViewportWidget(QtWidgets.QLabel):
             new_center_y = img_y - (rel_y - 0.5) * 2 * new_crop_half_h
 
             # Split into base center and pan offset
-            zoom_state['center_x'] = 0.5
-            zoom_state['center_y'] = 0.5
-            zoom_state['pan_x'] = new_center_x - 0.5
-            zoom_state['pan_y'] = new_center_y - 0.5
+            zoom_state.center_x = 0.5
+            zoom_state.center_y = 0.5
+            zoom_state.pan_x = new_center_x - 0.5
+            zoom_state.pan_y = new_center_y - 0.5
 
         # Update zoom
-        zoom_state['zoom'] = new_zoom
+        zoom_state.zoom = new_zoom
+        self._cell_transforms.pop(cell_idx, None)
 
         # If zoom is back to 1.0, remove the zoom state
         if new_zoom == 1.0:
@@ -813,23 +1205,25 @@ class ViewportWidget(QtWidgets.QLabel):
         Returns:
             Cell index, or -1 if out of bounds.
         """
-        if self._cell_width == 0 or self._cell_height == 0:
-            return 0 if self._current_rows == 1 and self._current_cols == 1 else -1
+        # Read the grid once: this runs on every mouse event
+        cell_width = self._cell_width
+        cell_height = self._cell_height
+        rows = self._current_rows
+        cols = self._current_cols
 
-        # Calculate cell row and column
-        cell_col = x // self._cell_width
-        cell_row = y // self._cell_height
+        if cell_width == 0 or cell_height == 0:
+            return 0 if rows == 1 and cols == 1 else -1
+
+        # Calculate cell row and column (integer division stays exact on cell
+        # borders, where a float reciprocal can round into the previous cell)
+        cell_col = x // cell_width
+        cell_row = y // cell_height
 
         # Check bounds
-        if cell_col < 0 or cell_col >= self._current_cols:
-            return -1
-        if cell_row < 0 or cell_row >= self._current_rows:
+        if not (0 <= cell_col < cols and 0 <= cell_row < rows):
             return -1
 
-        # Calculate cell index
-        cell_idx = cell_row * self._current_cols + cell_col
-
-        return cell_idx
+        return cell_row * cols + cell_col
 
     def _viewport_to_frame_coords(self, viewport_x: int, viewport_y: int, cell_idx: int, frame_shape: tuple) -> tuple[int, int] | None:
         """Convert viewport coordinates to original frame coordinates.
@@ -843,107 +1237,55 @@ class ViewportWidget(QtWidgets.QLabel):
         Returns:
             Tuple of (x, y) in original frame coordinates, or None if invalid.
         """
-        if self._cell_width == 0 or self._cell_height == 0:
+        cell_width = self._cell_width
+        cell_height = self._cell_height
+        if cell_width == 0 or cell_height == 0:
             return None
 
-        # Get cell position
-        cell_row = cell_idx // self._current_cols
-        cell_col = cell_idx % self._current_cols
-        cell_x = cell_col * self._cell_width
-        cell_y = cell_row * self._cell_height
-
-        # Position within cell
-        rel_x = viewport_x - cell_x
-        rel_y = viewport_y - cell_y
-
-        # Get frame dimensions
+        # The mapping is a per-axis scale and offset that only changes with the
+        # frame size, the grid and the cell's zoom state, so it is kept per cell
         frame_h, frame_w = frame_shape[:2]
+        key = (frame_w, frame_h, cell_width, cell_height, self._current_cols)
+        cached = self._cell_transforms.get(cell_idx)
+        if cached is None or cached[0] != key:
+            cached = (key, self._get_cell_transform(cell_idx, frame_w, frame_h, cell_width, cell_height))
+            self._cell_transforms[cell_idx] = cached
+        left, top, new_w, new_h, x1, y1, crop_w, crop_h = cached[1]
+
+        # Check if click is within the actual image area
+        rel_x = viewport_x - left
+        rel_y = viewport_y - top
+        if not (0 <= rel_x < new_w and 0 <= rel_y < new_h):
+            return None
 
-        # Account for zoom/pan if active
-        if cell_idx in self._zoom_states:
-            zoom_state = self._zoom_states[cell_idx]
-            zoom_factor = zoom_state['zoom']
-            center_x = zoom_state['center_x']
-            center_y = zoom_state['center_y']
-            pan_x = zoom_state.get('pan_x', 0.0)
-            pan_y = zoom_state.get('pan_y', 0.0)
-
-            # Calculate the visible region in the original frame
-            crop_w = int(frame_w / zoom_factor)
-            crop_h = int(frame_h / zoom_factor)
-
-            # Center with pan offset
-            center_x_px = center_x * frame_w + pan_x * frame_w
-            center_y_px = center_y * frame_h + pan_y * frame_h
-
-            # Crop coordinates
-            x1 = int(center_x_px - crop_w / 2)
-            y1 = int(center_y_px - crop_h / 2)
-            x1 = max(0, min(x1, frame_w - crop_w))
-            y1 = max(0, min(y1, frame_h - crop_h))
-
-            # Calculate aspect-preserving resize dimensions
-            aspect = frame_w / frame_h
-            cell_aspect = self._cell_width / self._cell_height
-
-            if aspect > cell_aspect:
-                new_w = self._cell_width
-                new_h = int(self._cell_width / aspect)
-            else:
-                new_h = self._cell_height
-                new_w = int(self._cell_height * aspect)
-
-            # Account for padding
-            x_offset = (self._cell_width - new_w) // 2
-            y_offset = (self._cell_height - new_h) // 2
-
-            # Check if click is within the actual image area
-            if rel_x < x_offset or rel_x >= x_offset + new_w:
-                return None
-            if rel_y < y_offset or rel_y >= y_offset + new_h:
-                return None
-
-            # Normalize to cropped region
-            norm_x = (rel_x - x_offset) / new_w
-            norm_y = (rel_y - y_offset) / new_h
-
-            # Map to original frame coordinates
-            frame_x = int(x1 + norm_x * crop_w)
-            frame_y = int(y1 + norm_y * crop_h)
-
-        else:
-            # No zoom - calculate aspect-preserving resize
-            aspect = frame_w / frame_h
-            cell_aspect = self._cell_width / self._cell_height
-
-            if aspect > cell_aspect:
-                new_w = self._cell_width
-                new_h = int(self._cell_width / aspect)
-            else:
-                new_h = self._cell_height
-                new_w = int(self._cell_height * aspect)
+        # Scale to the visible region of the original frame (always within bounds)
+        return (int(x1 + rel_x * crop_w // new_w), int(y1 + rel_y * crop_h // new_h))
 
-            # Account for padding
-            x_offset = (self._cell_width - new_w) // 2
-            y_offset = (self._cell_height - new_h) // 2
+    def _get_cell_transform(self, cell_idx: int, frame_w: int, frame_h: int, cell_width: int, cell_height: int) -> tuple[int, int, int, int, int, int, int, int]:
+        """Get the placement of a cell's image and the frame region it shows.
 
-            # Check if click is within the actual image area
-            if rel_x < x_offset or rel_x >= x_offset + new_w:
-                return None
-            if rel_y < y_offset or rel_y >= y_offset + new_h:
-                return None
+        Args:
+            cell_idx: Cell index.
+            frame_w: Frame width.
+            frame_h: Frame height.
+            cell_width: Cell width.
+            cell_height: Cell height.
 
-            # Normalize and map to original frame
-            norm_x = (rel_x - x_offset) / new_w
-            norm_y = (rel_y - y_offset) / new_h
-            frame_x = int(norm_x * frame_w)
-            frame_y = int(norm_y * frame_h)
+        Returns:
+            Tuple of (left, top, new_w, new_h, x, y, crop_w, crop_h): the image
+            rectangle in viewport coordinates and the visible frame region.
+        """
+        # Visible region of the frame (cropped if zoom/pan is active)
+        x1, y1, crop_w, crop_h = 0, 0, frame_w, frame_h
+        zoom_state = self._zoom_states.get(cell_idx)
+        if zoom_state is not None:
+            x1, y1, crop_w, crop_h = self._get_zoom_crop_rect(frame_w, frame_h, zoom_state)
 
-        # Clamp to frame bounds
-        frame_x = max(0, min(frame_x, frame_w - 1))
-        frame_y = max(0, min(frame_y, frame_h - 1))
+        # Same memoized aspect-preserving layout the cell was drawn with
+        new_w, new_h, x_offset, y_offset = self._get_cell_layout(cell_idx, crop_w, crop_h, cell_width, cell_height)
 
-        return (frame_x, frame_y)
+        cell_row, cell_col = divmod(cell_idx, self._current_cols)
+        return (cell_col * cell_width + x_offset, cell_row * cell_height + y_offset, new_w, new_h, x1, y1, crop_w, crop_h)
 
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
         """Handle mouse press events for panning and vertex dragging.
@@ -990,6 +1332,7 @@ class ViewportWidget(QtWidgets.QLabel):
                                     zone, vertex_idx = result
                                     self._dragging_vertex = (zone, vertex_idx, camera_name, cell_idx)
                                     self._drag_start_pos = (mouse_x, mouse_y)
+                                    self._drag_frame_shape = frame.shape
                                     self.setCursor(QtCore.Qt.CursorShape.ClosedHandCursor)
                                     event.accept()
                                     return
@@ -999,7 +1342,7 @@ class ViewportWidget(QtWidgets.QLabel):
             cell_idx = self._get_cell_at_position(mouse_x, mouse_y)
             if cell_idx >= 0:
                 # Only pan if this cell has zoom
-                if cell_idx in self._zoom_states and self._zoom_states[cell_idx]['zoom'] > 1.0:
+                if cell_idx in self._zoom_states and self._zoom_states[cell_idx].zoom > 1.0:
                     self._is_panning = True
                     self._pan_start_pos = (mouse_x, mouse_y)
                     self._pan_cell_idx = cell_idx
@@ -1015,58 +1358,53 @@ class ViewportWidget(QtWidgets.QLabel):
         Args:
             event: Mouse event.
         """
+        if self._dragging_vertex is None and not self._is_panning:
+            super().mouseMoveEvent(event)
+            return
+
         pos = event.position()
         mouse_x = int(pos.x())
         mouse_y = int(pos.y())
 
-        # Handle vertex dragging
-        if self._dragging_vertex is not None and self._get_frames_callback is not None:
-            zone, vertex_idx, camera_name, cell_idx = self._dragging_vertex
-
-            # Get frames to access frame shape
-            frames = self._get_frames_callback()
-            if frames and 0 <= cell_idx < len(frames):
-                frame = frames[cell_idx]
-                if frame is not None:
-                    # Convert viewport coords to frame coords
-                    frame_coords = self._viewport_to_frame_coords(mouse_x, mouse_y, cell_idx, frame.shape)
-
-                    if frame_coords is not None:
-                        frame_x, frame_y = frame_coords
-
-                        # Update vertex position
-                        vertices = list(zone.camera_mapping.vertices)
-                        vertices[vertex_idx] = (frame_x, frame_y)
-                        zone.camera_mapping.vertices = vertices
-
-                        # Invalidate overlay to force regeneration
-                        zone.camera_mapping.invalidate_overlay()
-
-                        # Emit signal to update UI
-                        self.vertex_updated.emit(zone.name)
-
-                        event.accept()
-                        return
+        # Handle vertex dragging: keep only the latest position until the next flush
+        if self._dragging_vertex is not None:
+            drag_pos = (mouse_x, mouse_y)
+            if drag_pos == self._last_drag_viewport_pos:
+                event.accept()
+                return
+            self._last_drag_viewport_pos = drag_pos
+            self._pending_drag_pos = drag_pos
+            if not self._drag_flush_timer.isActive():
+                self._drag_flush_timer.start()
+            event.accept()
+            return
 
         # Handle panning
-        if self._is_panning and self._pan_start_pos is not None:
-            # Calculate delta
-            dx = mouse_x - self._pan_start_pos[0]
-            dy = mouse_y - self._pan_start_pos[1]
+        pan_start_pos = self._pan_start_pos
+        if self._is_panning and pan_start_pos is not None:
+            # Calculate delta (repeated events at the same position change nothing)
+            dx = mouse_x - pan_start_pos[0]
+            dy = mouse_y - pan_start_pos[1]
+            if dx == 0 and dy == 0:
+                event.accept()
+                return
 
             # Update pan offset (normalized to cell size)
-            if self._pan_cell_idx in self._zoom_states:
-                zoom_state = self._zoom_states[self._pan_cell_idx]
-                zoom_factor = zoom_state['zoom']
+            zoom_state = self._zoom_states.get(self._pan_cell_idx)
+            if zoom_state is not None:
+                zoom_factor = zoom_state.zoom
+                cell_width = self._cell_width
+                cell_height = self._cell_height
 
                 # Convert pixel delta to normalized delta in the zoomed view
                 # The cell shows a region of size 1/zoom, so pixel movement needs scaling
-                if self._cell_width > 0 and self._cell_height > 0:
-                    norm_dx = -(dx / self._cell_width) / zoom_factor
-                    norm_dy = -(dy / self._cell_height) / zoom_factor
+                if cell_width > 0 and cell_height > 0:
+                    norm_dx = -(dx / cell_width) / zoom_factor
+                    norm_dy = -(dy / cell_height) / zoom_factor
 
-                    zoom_state['pan_x'] += norm_dx
-                    zoom_state['pan_y'] += norm_dy
+                    zoom_state.pan_x += norm_dx
+                    zoom_state.pan_y += norm_dy
+                    self._cell_transforms.pop(self._pan_cell_idx, None)
 
                     # Update start position for next delta
                     self._pan_start_pos = (mouse_x, mouse_y)
@@ -1076,6 +1414,28 @@ class ViewportWidget(QtWidgets.QLabel):
 
         super().mouseMoveEvent(event)
 
+    def _flush_drag(self) -> None:
+        """Apply the latest pending drag position to the dragged vertex."""
+        if self._dragging_vertex is None or self._pending_drag_pos is None:
+            return
+
+        mouse_x, mouse_y = self._pending_drag_pos
+        self._pending_drag_pos = None
+        zone, vertex_idx, camera_name, cell_idx = self._dragging_vertex
+
+        # Convert viewport coords to frame coords (frame shape captured at drag start)
+        frame_coords = self._viewport_to_frame_coords(mouse_x, mouse_y, cell_idx, self._drag_frame_shape)
+
+        # Nothing to do while the pointer stays on the vertex's current frame pixel
+        if frame_coords is not None and zone.camera_mapping.vertices[vertex_idx] != frame_coords:
+            frame_x, frame_y = frame_coords
+
+            # Update vertex position and invalidate overlay to force regeneration
+            zone.camera_mapping.update_vertex(vertex_idx, frame_x, frame_y)
+
+            # Emit signal to update UI
+            self.vertex_updated.emit(zone.name)
+
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent) -> None:
         """Handle mouse release events for panning and vertex dragging.
 
@@ -1083,9 +1443,13 @@ class ViewportWidget(QtWidgets.QLabel):
             event: Mouse event.
         """
         if event.button() == QtCore.Qt.MouseButton.LeftButton and self._dragging_vertex is not None:
-            # End vertex dragging
+            # Apply the last move before ending vertex dragging
+            self._drag_flush_timer.stop()
+            self._flush_drag()
             self._dragging_vertex = None
             self._drag_start_pos = None
+            self._drag_frame_shape = None
+            self._last_drag_viewport_pos = None
             self.setCursor(QtCore.Qt.CursorShape.ArrowCursor)
             event.accept()
             return
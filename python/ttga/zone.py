@@ -19,9 +19,195 @@ from dataclasses import dataclass, field
 import cv2
 import numpy as np
 
+# Default mapping quad, shared by all new mappings (each gets its own list)
+_DEFAULT_MAPPING_VERTICES = (
+    (128, 128),   # P0: Cyan (0, 0)
+    (384, 128),   # P1: Magenta (wpx, 0)
+    (384, 256),   # P2: Yellow (wpx, hpx)
+    (128, 256)    # P3: White (0, hpx)
+)
 
-@dataclass
-class CameraMapping:
+
+def _transform_point(pos: tuple[float, float], matrix_entries: tuple[float, ...]) -> tuple[float, float]:
+    """Apply a perspective transform to a single point.
+
+    Plain float arithmetic on the 9 matrix entries, which is several times
+    faster than building and multiplying small arrays for one point.
+
+    Args:
+        pos: The (x, y) position.
+        matrix_entries: Row-major entries of the 3x3 perspective transform matrix.
+
+    Returns:
+        Transformed (x, y) position.
+    """
+    m00, m01, m02, m10, m11, m12, m20, m21, m22 = matrix_entries
+    x = float(pos[0])
+    y = float(pos[1])
+    w = m20 * x + m21 * y + m22
+    return ((m00 * x + m01 * y + m02) / w, (m10 * x + m11 * y + m12) / w)
+
+
+def _transform_points(points: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """Apply a perspective transform to many points in a single call.
+
+    Args:
+        points: Array-like of shape (N, 2) with (x, y) positions.
+        matrix: 3x3 perspective transform matrix.
+
+    Returns:
+        Array of shape (N, 2) with the transformed positions (float64).
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 1, 2)
+    if points.shape[0] == 0:
+        return np.empty((0, 2), dtype=np.float64)
+    return cv2.perspectiveTransform(points, matrix).reshape(-1, 2)
+
+
+def _draw_mapping_overlay(
+    vertices: list[tuple[int, int]],
+    lock_vertices: bool,
+    draw_locked_borders: bool,
+    frame_shape: tuple[int, int, int],
+    cached_overlay: tuple | None,
+    buffer: np.ndarray | None
+) -> tuple | None:
+    """Draw the vertices and edges of a mapping quad into a BGRA ROI overlay.
+
+    Shared by the camera and projector overlays of a zone.
+
+    Args:
+        vertices: The 4 quad vertices in frame coordinates.
+        lock_vertices: Whether vertices are locked (only edges are drawn).
+        draw_locked_borders: Whether edges are drawn while vertices are locked.
+        frame_shape: Shape of the frame (height, width, channels).
+        cached_overlay: Previous valid overlay, returned as-is if its ROI still matches.
+        buffer: Previous overlay array, cleared and redrawn if the ROI size matches
+            (consumers copy the overlay, never keep the array).
+
+    Returns:
+        Tuple of (overlay, x, y, width, height), or None if the ROI is empty.
+    """
+    from .constants import VERTEX_RADIUS, EDGE_THICKNESS, VERTEX_CIRCLE_THICKNESS
+
+    # Calculate bounding box of vertices with padding for drawing
+    padding = VERTEX_RADIUS + VERTEX_CIRCLE_THICKNESS + 2  # Extra padding for anti-aliasing
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = vertices
+
+    x_min = max(0, min(x0, x1, x2, x3) - padding)
+    y_min = max(0, min(y0, y1, y2, y3) - padding)
+    x_max = min(frame_shape[1] - 1, max(x0, x1, x2, x3) + padding)
+    y_max = min(frame_shape[0] - 1, max(y0, y1, y2, y3) + padding)
+
+    roi_width = x_max - x_min + 1
+    roi_height = y_max - y_min + 1
+
+    # Validate ROI has positive dimensions
+    if roi_width <= 0 or roi_height <= 0:
+        return None
+
+    # Check if we can use cached overlay (must match current ROI dimensions)
+    if cached_overlay is not None and cached_overlay[1:] == (x_min, y_min, roi_width, roi_height):
+        return cached_overlay
+
+    # Create transparent BGRA image for ROI only
+    overlay = buffer
+    if overlay is not None and overlay.shape[0] == roi_height and overlay.shape[1] == roi_width:
+        overlay.fill(0)
+    else:
+        overlay = np.zeros((roi_height, roi_width, 4), dtype=np.uint8)
+
+    # Vertex colors (BGR format): P0=Cyan, P1=Magenta, P2=Yellow, P3=White
+    vertex_colors = [
+        (255, 255, 0),    # P0: Cyan
+        (255, 0, 255),    # P1: Magenta
+        (0, 255, 255),    # P2: Yellow
+        (255, 255, 255)   # P3: White
+    ]
+
+    # Adjust vertices to ROI coordinates
+    roi_vertices = [(x - x_min, y - y_min) for x, y in vertices]
+
+    # Draw edges if draw_locked_borders is enabled or vertices are unlocked
+    if draw_locked_borders or not lock_vertices:
+        edge_color = (255, 255, 255, 255)  # White BGRA
+        pts = np.array(roi_vertices, dtype=np.int32)
+
+        # Draw quadrilateral edges with anti-aliasing
+        for i in range(4):
+            pt1 = tuple(pts[i])
+            pt2 = tuple(pts[(i + 1) % 4])
+            cv2.line(overlay, pt1, pt2, edge_color, EDGE_THICKNESS, cv2.LINE_AA)
+
+    # Draw vertices only if unlocked
+    if not lock_vertices:
+        for i, (x, y) in enumerate(roi_vertices):
+            color_bgr = vertex_colors[i]
+            color_bgra = (*color_bgr, 255)  # Add alpha channel
+            cv2.circle(overlay, (x, y), VERTEX_RADIUS, color_bgra, VERTEX_CIRCLE_THICKNESS, cv2.LINE_AA)
+
+    return (overlay, x_min, y_min, roi_width, roi_height)
+
+
+@dataclass(slots=True)
+class _MappingMixin:
+    """Overlay cache and methods shared by CameraMapping and ProjectorMapping.
+
+    Subclasses provide the vertices field. None of these fields are constructor
+    arguments or serialized.
+
+    Attributes:
+        overlay_needs_update: Flag indicating overlay image needs regeneration.
+        overlay: Cached overlay as (overlay, x, y, width, height).
+        overlay_frame_shape: Frame (height, width) the cached overlay was made for.
+        overlay_buffer: Overlay array reused when redrawing at the same ROI size.
+        matrix_entries: Cached matrix entries by matrix name: (matrix, entries).
+    """
+    overlay_needs_update: bool = field(default=True, init=False, repr=False)
+    overlay: tuple | None = field(default=None, init=False, repr=False)
+    overlay_frame_shape: tuple[int, int] | None = field(default=None, init=False, repr=False)
+    overlay_buffer: np.ndarray | None = field(default=None, init=False, repr=False)
+    matrix_entries: dict[str, tuple] = field(default_factory=dict, init=False, repr=False)
+
+    def get_matrix_entries(self, matrix_name: str) -> tuple[float, ...]:
+        """Get the 9 entries of a transform matrix as Python floats.
+
+        The entries are cached until the matrix attribute is assigned a new array
+        (calibration, loading), so single point transforms skip array access.
+
+        Args:
+            matrix_name: Name of the matrix attribute (e.g. 'camera_to_game_matrix').
+
+        Returns:
+            Row-major tuple of the 9 matrix entries.
+        """
+        matrix = getattr(self, matrix_name)
+        cached = self.matrix_entries.get(matrix_name)
+        if cached is None or cached[0] is not matrix:
+            cached = (matrix, tuple(matrix.ravel().tolist()))
+            self.matrix_entries[matrix_name] = cached
+        return cached[1]
+
+    def invalidate_overlay(self) -> None:
+        """Mark overlay as needing update and clear cached overlay."""
+        self.overlay_needs_update = True
+        self.overlay = None
+
+    def update_vertex(self, vertex_idx: int, x: int, y: int) -> None:
+        """Move one vertex in place and invalidate the overlay and matrix entries.
+
+        Args:
+            vertex_idx: Index of the vertex to move.
+            x: New x coordinate.
+            y: New y coordinate.
+        """
+        self.vertices[vertex_idx] = (x, y)
+        self.matrix_entries.clear()
+        self.invalidate_overlay()
+
+
+@dataclass(slots=True)
+class CameraMapping(_MappingMixin):
     """Camera mapping for a zone.
 
     Attributes:
@@ -33,24 +219,15 @@ class CameraMapping:
         camera_to_game_matrix: Transform matrix from camera to game coordinates.
         game_to_camera_matrix: Transform matrix from game to camera coordinates.
         roi: ROI bounding box dict with min_x, min_y, max_x, max_y.
-        overlay_needs_update: Flag indicating overlay image needs regeneration.
-        camera_overlay: Cached overlay image (not serialized).
     """
     camera_name: str
-    vertices: list[tuple[int, int]] = field(default_factory=lambda: [
-        (128, 128),   # P0: Cyan (0, 0)
-        (384, 128),   # P1: Magenta (wpx, 0)
-        (384, 256),   # P2: Yellow (wpx, hpx)
-        (128, 256)    # P3: White (0, hpx)
-    ])
+    vertices: list[tuple[int, int]] = field(default_factory=lambda: list(_DEFAULT_MAPPING_VERTICES))
     lock_vertices: bool = False
     enabled: bool = True
     is_calibrated: bool = False
     camera_to_game_matrix: np.ndarray | None = None
     game_to_camera_matrix: np.ndarray | None = None
     roi: dict[str, int] | None = None
-    overlay_needs_update: bool = field(default=True, init=False, repr=False)
-    camera_overlay: any = field(default=None, init=False, repr=False)
 
     def to_dict(self) -> dict:
         """Serialize camera mapping to dictionary.
@@ -58,7 +235,7 @@ class CameraMapping:
         Returns:
             Dictionary containing camera mapping data.
         """
-        # Note: overlay_needs_update and camera_overlay are not serialized
+        # Note: the overlay cache fields are not serialized
         result = {
             'camera_name': self.camera_name,
             'vertices': self.vertices,
@@ -74,11 +251,6 @@ class CameraMapping:
             result['game_to_camera_matrix'] = self.game_to_camera_matrix.tolist()
         return result
 
-    def invalidate_overlay(self) -> None:
-        """Mark overlay as needing update and clear cached overlay."""
-        self.overlay_needs_update = True
-        self.camera_overlay = None
-
     @staticmethod
     def from_dict(data: dict) -> 'CameraMapping':
         """Deserialize camera mapping from dictionary.
@@ -91,7 +263,7 @@ class CameraMapping:
         """
         mapping = CameraMapping(
             camera_name=data['camera_name'],
-            vertices=[tuple(v) for v in data['vertices']],
+            vertices=list(map(tuple, data['vertices'])),
             lock_vertices=data.get('lock_vertices', False),
             enabled=data.get('enabled', True),
             is_calibrated=data.get('is_calibrated', False),
@@ -105,8 +277,8 @@ class CameraMapping:
         return mapping
 
 
-@dataclass
-class ProjectorMapping:
+@dataclass(slots=True)
+class ProjectorMapping(_MappingMixin):
     """Projector mapping for a zone.
 
     Attributes:
@@ -118,34 +290,15 @@ class ProjectorMapping:
         projector_to_game_matrix: Transform matrix from projector to game coordinates.
         game_to_projector_matrix: Transform matrix from game to projector coordinates.
         roi: ROI bounding box dict with min_x, min_y, max_x, max_y.
-        overlay_needs_update: Flag indicating overlay image needs regeneration.
-        projector_overlay: Cached overlay image (not serialized).
     """
     projector_name: str
-    vertices: list[tuple[int, int]] = field(default_factory=lambda: [
-        (128, 128),   # P0: Cyan (0, 0)
-        (384, 128),   # P1: Magenta (wpx, 0)
-        (384, 256),   # P2: Yellow (wpx, hpx)
-        (128, 256)    # P3: White (0, hpx)
-    ])
+    vertices: list[tuple[int, int]] = field(default_factory=lambda: list(_DEFAULT_MAPPING_VERTICES))
     lock_vertices: bool = False
     enabled: bool = True
     is_calibrated: bool = False
     projector_to_game_matrix: np.ndarray | None = None
     game_to_projector_matrix: np.ndarray | None = None
     roi: dict[str, int] | None = None
-    overlay_needs_update: bool = field(default=True, init=False, repr=False)
-    projector_overlay: tuple | None = field(default=None, init=False, repr=False)
-
-    def __post_init__(self):
-        """Initialize overlay fields after dataclass initialization."""
-        self.overlay_needs_update = True
-        self.projector_overlay = None
-
-    def invalidate_overlay(self) -> None:
-        """Mark overlay as needing update and clear cached overlay."""
-        self.overlay_needs_update = True
-        self.projector_overlay = None
 
     def to_dict(self) -> dict:
         """Serialize projector mapping to dictionary.
@@ -180,7 +333,7 @@ class ProjectorMapping:
         """
         mapping = ProjectorMapping(
             projector_name=data['projector_name'],
-            vertices=[tuple(v) for v in data['vertices']],
+            vertices=list(map(tuple, data['vertices'])),
             lock_vertices=data.get('lock_vertices', False),
             enabled=data.get('enabled', True),
             is_calibrated=data.get('is_calibrated', False),
@@ -287,81 +440,13 @@ class Zone:
         Returns:
             Tuple of (overlay, x, y, width, height) where overlay is a BGRA ROI image,
             or None if no camera mapping. The x, y, width, height define the ROI position.
-        """
-        from .constants import VERTEX_RADIUS, EDGE_THICKNESS, VERTEX_CIRCLE_THICKNESS
-
-        if not self.camera_mapping or not self.camera_mapping.enabled:
-            return None
-
-        # Early return if nothing to draw (vertices locked and borders disabled)
-        if self.camera_mapping.lock_vertices and not self.draw_locked_borders:
-            return None
-
-        vertices = self.camera_mapping.vertices
-
-        # Calculate bounding box of vertices with padding for drawing
-        padding = VERTEX_RADIUS + VERTEX_CIRCLE_THICKNESS + 2  # Extra padding for anti-aliasing
-        xs = [v[0] for v in vertices]
-        ys = [v[1] for v in vertices]
-
-        x_min = max(0, min(xs) - padding)
-        y_min = max(0, min(ys) - padding)
-        x_max = min(frame_shape[1] - 1, max(xs) + padding)
-        y_max = min(frame_shape[0] - 1, max(ys) + padding)
-
-        roi_width = x_max - x_min + 1
-        roi_height = y_max - y_min + 1
 
-        # Validate ROI has positive dimensions
-        if roi_width <= 0 or roi_height <= 0:
-            return None
-
-        # Check if we can use cached overlay (must match current ROI dimensions)
-        if (self.camera_mapping.camera_overlay is not None and
-                not self.camera_mapping.overlay_needs_update):
-            cached_overlay, cached_x, cached_y, cached_w, cached_h = self.camera_mapping.camera_overlay
-            if (cached_x == x_min and cached_y == y_min and
-                    cached_w == roi_width and cached_h == roi_height):
-                return self.camera_mapping.camera_overlay
-
-        # Create transparent BGRA image for ROI only
-        overlay = np.zeros((roi_height, roi_width, 4), dtype=np.uint8)
-
-        # Vertex colors (BGR format): P0=Cyan, P1=Magenta, P2=Yellow, P3=White
-        vertex_colors = [
-            (255, 255, 0),    # P0: Cyan
-            (255, 0, 255),    # P1: Magenta
-            (0, 255, 255),    # P2: Yellow
-            (255, 255, 255)   # P3: White
-        ]
-
-        # Adjust vertices to ROI coordinates
-        roi_vertices = [(x - x_min, y - y_min) for x, y in vertices]
-
-        # Draw edges if draw_locked_borders is enabled or vertices are unlocked
-        if self.draw_locked_borders or not self.camera_mapping.lock_vertices:
-            edge_color = (255, 255, 255, 255)  # White BGRA
-            pts = np.array(roi_vertices, dtype=np.int32)
-
-            # Draw quadrilateral edges with anti-aliasing
-            for i in range(4):
-                pt1 = tuple(pts[i])
-                pt2 = tuple(pts[(i + 1) % 4])
-                cv2.line(overlay, pt1, pt2, edge_color, EDGE_THICKNESS, cv2.LINE_AA)
-
-        # Draw vertices only if unlocked
-        if not self.camera_mapping.lock_vertices:
-            for i, (x, y) in enumerate(roi_vertices):
-                color_bgr = vertex_colors[i]
-                color_bgra = (*color_bgr, 255)  # Add alpha channel
-                cv2.circle(overlay, (x, y), VERTEX_RADIUS, color_bgra, VERTEX_CIRCLE_THICKNESS, cv2.LINE_AA)
-
-        # Cache the overlay with ROI info
-        result = (overlay, x_min, y_min, roi_width, roi_height)
-        self.camera_mapping.camera_overlay = result
-        self.camera_mapping.overlay_needs_update = False
-
-        return result
+        Note:
+            The same tuple is returned until the overlay is regenerated. When the
+            ROI size is unchanged, regenerating clears and redraws the previous
+            overlay array in place, so copy the array to keep it past that.
+        """
+        return self._get_overlay(self.camera_mapping, frame_shape)
 
     def get_projector_overlay(self, frame_shape: tuple[int, int, int]):
         """Generate or retrieve cached projector overlay with vertices and edges.
@@ -372,79 +457,54 @@ class Zone:
         Returns:
             Tuple of (overlay, x, y, width, height) where overlay is a BGRA ROI image,
             or None if no projector mapping. The x, y, width, height define the ROI position.
+
+        Note:
+            The same tuple is returned until the overlay is regenerated. When the
+            ROI size is unchanged, regenerating clears and redraws the previous
+            overlay array in place, so copy the array to keep it past that.
         """
-        from .constants import VERTEX_RADIUS, EDGE_THICKNESS, VERTEX_CIRCLE_THICKNESS
+        return self._get_overlay(self.projector_mapping, frame_shape)
+
+    def _get_overlay(self, mapping: CameraMapping | ProjectorMapping | None, frame_shape: tuple[int, int, int]):
+        """Generate or retrieve the cached overlay of a camera or projector mapping.
 
-        if not self.projector_mapping or not self.projector_mapping.enabled:
+        Args:
+            mapping: CameraMapping or ProjectorMapping of this zone, or None.
+            frame_shape: Shape of the frame (height, width, channels).
+
+        Returns:
+            Tuple of (overlay, x, y, width, height), or None if there is nothing to draw.
+        """
+        if not mapping or not mapping.enabled:
             return None
 
         # Early return if nothing to draw (vertices locked and borders disabled)
-        if self.projector_mapping.lock_vertices and not self.draw_locked_borders:
+        if mapping.lock_vertices and not self.draw_locked_borders:
             return None
 
-        vertices = self.projector_mapping.vertices
-
-        # Calculate bounding box of vertices with padding for drawing
-        padding = VERTEX_RADIUS + VERTEX_CIRCLE_THICKNESS + 2  # Extra padding for anti-aliasing
-        xs = [v[0] for v in vertices]
-        ys = [v[1] for v in vertices]
-
-        x_min = max(0, min(xs) - padding)
-        y_min = max(0, min(ys) - padding)
-        x_max = min(frame_shape[1] - 1, max(xs) + padding)
-        y_max = min(frame_shape[0] - 1, max(ys) + padding)
-
-        roi_width = x_max - x_min + 1
-        roi_height = y_max - y_min + 1
-
-        # Validate ROI has positive dimensions
-        if roi_width <= 0 or roi_height <= 0:
+        # The cached overlay stays valid until the mapping is invalidated (vertex
+        # moved, lock/border change) or the frame size changes
+        if (mapping.overlay is not None and
+                not mapping.overlay_needs_update and
+                mapping.overlay_frame_shape == frame_shape[:2]):
+            return mapping.overlay
+
+        result = _draw_mapping_overlay(
+            mapping.vertices,
+            mapping.lock_vertices,
+            self.draw_locked_borders,
+            frame_shape,
+            None if mapping.overlay_needs_update else mapping.overlay,
+            mapping.overlay_buffer
+        )
+        if result is None:
             return None
 
-        # Check if we can use cached overlay (must match current ROI dimensions)
-        if (self.projector_mapping.projector_overlay is not None and
-                not self.projector_mapping.overlay_needs_update):
-            cached_overlay, cached_x, cached_y, cached_w, cached_h = self.projector_mapping.projector_overlay
-            if (cached_x == x_min and cached_y == y_min and
-                    cached_w == roi_width and cached_h == roi_height):
-                return self.projector_mapping.projector_overlay
-
-        # Create transparent BGRA image for ROI only
-        overlay = np.zeros((roi_height, roi_width, 4), dtype=np.uint8)
-
-        # Vertex colors (BGR format): P0=Cyan, P1=Magenta, P2=Yellow, P3=White
-        vertex_colors = [
-            (255, 255, 0),    # P0: Cyan
-            (255, 0, 255),    # P1: Magenta
-            (0, 255, 255),    # P2: Yellow
-            (255, 255, 255)   # P3: White
-        ]
-
-        # Adjust vertices to ROI coordinates
-        roi_vertices = [(x - x_min, y - y_min) for x, y in vertices]
-
-        # Draw edges if draw_locked_borders is enabled or vertices are unlocked
-        if self.draw_locked_borders or not self.projector_mapping.lock_vertices:
-            edge_color = (255, 255, 255, 255)  # White BGRA
-            pts = np.array(roi_vertices, dtype=np.int32)
-
-            # Draw quadrilateral edges with anti-aliasing
-            for i in range(4):
-                pt1 = tuple(pts[i])
-                pt2 = tuple(pts[(i + 1) % 4])
-                cv2.line(overlay, pt1, pt2, edge_color, EDGE_THICKNESS, cv2.LINE_AA)
-
-        # Draw vertices only if unlocked
-        if not self.projector_mapping.lock_vertices:
-            for i, (x, y) in enumerate(roi_vertices):
-                color_bgr = vertex_colors[i]
-                color_bgra = (*color_bgr, 255)  # Add alpha channel
-                cv2.circle(overlay, (x, y), VERTEX_RADIUS, color_bgra, VERTEX_CIRCLE_THICKNESS, cv2.LINE_AA)
-
         # Cache the overlay with ROI info
-        result = (overlay, x_min, y_min, roi_width, roi_height)
-        self.projector_mapping.projector_overlay = result
-        self.projector_mapping.overlay_needs_update = False
+        mapping.overlay = result
+        mapping.overlay_buffer = result[0]
+        mapping.overlay_frame_shape = frame_shape[:2]
+        mapping.overlay_needs_update = False
 
         return result
 
@@ -474,13 +534,11 @@ class Zone:
         if not self.camera_mapping or not self.camera_mapping.is_calibrated:
             raise ValueError("Camera mapping is not calibrated")
 
-        pos_homo = np.float32([pos[0], pos[1], 1.0])
-        warp_pos_homo = self.camera_mapping.camera_to_game_matrix.dot(pos_homo)
-        warp_pos = (warp_pos_homo / warp_pos_homo[2])[:2]
+        warp_pos = _transform_point(pos, self.camera_mapping.get_matrix_entries('camera_to_game_matrix'))
 
         if rounded:
             return (round(warp_pos[0]), round(warp_pos[1]))
-        return tuple(warp_pos)
+        return warp_pos
 
     def game_to_camera(self, pos: tuple[float, float], rounded: bool = False) -> tuple[float, float]:
         """Transform a position from game coordinates to camera coordinates.
@@ -498,13 +556,11 @@ class Zone:
         if not self.camera_mapping or not self.camera_mapping.is_calibrated:
             raise ValueError("Camera mapping is not calibrated")
 
-        pos_homo = np.float32([pos[0], pos[1], 1.0])
-        warp_pos_homo = self.camera_mapping.game_to_camera_matrix.dot(pos_homo)
-        warp_pos = (warp_pos_homo / warp_pos_homo[2])[:2]
+        warp_pos = _transform_point(pos, self.camera_mapping.get_matrix_entries('game_to_camera_matrix'))
 
         if rounded:
             return (round(warp_pos[0]), round(warp_pos[1]))
-        return tuple(warp_pos)
+        return warp_pos
 
     def projector_to_game(self, pos: tuple[float, float], rounded: bool = False) -> tuple[float, float]:
         """Transform a position from projector coordinates to game coordinates.
@@ -522,13 +578,11 @@ class Zone:
         if not self.projector_mapping or not self.projector_mapping.is_calibrated:
             raise ValueError("Projector mapping is not calibrated")
 
-        pos_homo = np.float32([pos[0], pos[1], 1.0])
-        warp_pos_homo = self.projector_mapping.projector_to_game_matrix.dot(pos_homo)
-        warp_pos = (warp_pos_homo / warp_pos_homo[2])[:2]
+        warp_pos = _transform_point(pos, self.projector_mapping.get_matrix_entries('projector_to_game_matrix'))
 
         if rounded:
             return (round(warp_pos[0]), round(warp_pos[1]))
-        return tuple(warp_pos)
+        return warp_pos
 
     def game_to_projector(self, pos: tuple[float, float], rounded: bool = False) -> tuple[float, float]:
         """Transform a position from game coordinates to projector coordinates.
@@ -546,13 +600,79 @@ class Zone:
         if not self.projector_mapping or not self.projector_mapping.is_calibrated:
             raise ValueError("Projector mapping is not calibrated")
 
-        pos_homo = np.float32([pos[0], pos[1], 1.0])
-        warp_pos_homo = self.projector_mapping.game_to_projector_matrix.dot(pos_homo)
-        warp_pos = (warp_pos_homo / warp_pos_homo[2])[:2]
+        warp_pos = _transform_point(pos, self.projector_mapping.get_matrix_entries('game_to_projector_matrix'))
 
         if rounded:
             return (round(warp_pos[0]), round(warp_pos[1]))
-        return tuple(warp_pos)
+        return warp_pos
+
+    def camera_to_game_batch(self, points: np.ndarray) -> np.ndarray:
+        """Transform many positions from camera coordinates to game coordinates at once.
+
+        Args:
+            points: Array-like of shape (N, 2) with (x, y) positions in camera ROI coordinates.
+
+        Returns:
+            Array of shape (N, 2) with the transformed positions in game coordinates.
+
+        Raises:
+            ValueError: If camera mapping is not calibrated.
+        """
+        if not self.camera_mapping or not self.camera_mapping.is_calibrated:
+            raise ValueError("Camera mapping is not calibrated")
+
+        return _transform_points(points, self.camera_mapping.camera_to_game_matrix)
+
+    def game_to_camera_batch(self, points: np.ndarray) -> np.ndarray:
+        """Transform many positions from game coordinates to camera coordinates at once.
+
+        Args:
+            points: Array-like of shape (N, 2) with (x, y) positions in game coordinates.
+
+        Returns:
+            Array of shape (N, 2) with the transformed positions in camera ROI coordinates.
+
+        Raises:
+            ValueError: If camera mapping is not calibrated.
+        """
+        if not self.camera_mapping or not self.camera_mapping.is_calibrated:
+            raise ValueError("Camera mapping is not calibrated")
+
+        return _transform_points(points, self.camera_mapping.game_to_camera_matrix)
+
+    def projector_to_game_batch(self, points: np.ndarray) -> np.ndarray:
+        """Transform many positions from projector coordinates to game coordinates at once.
+
+        Args:
+            points: Array-like of shape (N, 2) with (x, y) positions in projector ROI coordinates.
+
+        Returns:
+            Array of shape (N, 2) with the transformed positions in game coordinates.
+
+        Raises:
+            ValueError: If projector mapping is not calibrated.
+        """
+        if not self.projector_mapping or not self.projector_mapping.is_calibrated:
+            raise ValueError("Projector mapping is not calibrated")
+
+        return _transform_points(points, self.projector_mapping.projector_to_game_matrix)
+
+    def game_to_projector_batch(self, points: np.ndarray) -> np.ndarray:
+        """Transform many positions from game coordinates to projector coordinates at once.
+
+        Args:
+            points: Array-like of shape (N, 2) with (x, y) positions in game coordinates.
+
+        Returns:
+            Array of shape (N, 2) with the transformed positions in projector ROI coordinates.
+
+        Raises:
+            ValueError: If projector mapping is not calibrated.
+        """
+        if not self.projector_mapping or not self.projector_mapping.is_calibrated:
+            raise ValueError("Projector mapping is not calibrated")
+
+        return _transform_points(points, self.projector_mapping.game_to_projector_matrix)
 
     def warp_game_to_camera(self, image: np.ndarray) -> np.ndarray:
         """Warp a game image to camera ROI coordinates.
@@ -623,13 +743,12 @@ class Zone:
             vertices = self.camera_mapping.vertices
 
             # Calculate ROI
-            xs = [v[0] for v in vertices]
-            ys = [v[1] for v in vertices]
+            (x0, y0), (x1, y1), (x2, y2), (x3, y3) = vertices
             roi = {
-                'min_x': min(xs),
-                'min_y': min(ys),
-                'max_x': max(xs),
-                'max_y': max(ys)
+                'min_x': min(x0, x1, x2, x3),
+                'min_y': min(y0, y1, y2, y3),
+                'max_x': max(x0, x1, x2, x3),
+                'max_y': max(y0, y1, y2, y3)
             }
 
             # Adjust vertices to ROI coordinates
@@ -649,13 +768,12 @@ class Zone:
             vertices = self.projector_mapping.vertices
 
             # Calculate ROI
-            xs = [v[0] for v in vertices]
-            ys = [v[1] for v in vertices]
+            (x0, y0), (x1, y1), (x2, y2), (x3, y3) = vertices
             roi = {
-                'min_x': min(xs),
-                'min_y': min(ys),
-                'max_x': max(xs),
-                'max_y': max(ys)
+                'min_x': min(x0, x1, x2, x3),
+                'min_y': min(y0, y1, y2, y3),
+                'max_x': max(x0, x1, x2, x3),
+                'max_y': max(y0, y1, y2, y3)
             }
 
             # Adjust vertices to ROI coordinates
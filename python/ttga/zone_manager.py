@@ -163,11 +163,12 @@ class ZoneManager(QtCore.QObject):
             Tuple of (Zone, vertex_index) if found, None otherwise.
             If multiple vertices are within max_distance, returns the closest one.
         """
-        import math
-
         closest_zone = None
         closest_vertex_idx = -1
-        closest_distance = float('inf')
+
+        # Compare squared distances (no square root per vertex)
+        max_distance_sq = max_distance * max_distance
+        closest_distance_sq = float('inf')
 
         # Check all zones with camera mapping enabled for this camera
         for zone in self.get_zones_with_camera_mapping(camera_name):
@@ -177,11 +178,17 @@ class ZoneManager(QtCore.QObject):
 
             # Check each vertex
             for idx, (vx, vy) in enumerate(zone.camera_mapping.vertices):
-                distance = math.sqrt((x - vx) ** 2 + (y - vy) ** 2)
+                dx = x - vx
+                dy = y - vy
+
+                # Cheap reject outside the max_distance square
+                if abs(dx) > max_distance or abs(dy) > max_distance:
+                    continue
 
                 # Check if within max_distance and closer than previous best
-                if distance <= max_distance and distance < closest_distance:
-                    closest_distance = distance
+                distance_sq = dx * dx + dy * dy
+                if distance_sq <= max_distance_sq and distance_sq < closest_distance_sq:
+                    closest_distance_sq = distance_sq
                     closest_zone = zone
                     closest_vertex_idx = idx
 
@@ -202,11 +209,12 @@ class ZoneManager(QtCore.QObject):
             Tuple of (Zone, vertex_index) if found, None otherwise.
             If multiple vertices are within max_distance, returns the closest one.
         """
-        import math
-
         closest_zone = None
         closest_vertex_idx = -1
-        closest_distance = float('inf')
+
+        # Compare squared distances (no square root per vertex)
+        max_distance_sq = max_distance * max_distance
+        closest_distance_sq = float('inf')
 
         # Check all zones with projector mapping enabled for this projector
         for zone in self.get_zones_with_projector_mapping(projector_name):
@@ -216,11 +224,17 @@ class ZoneManager(QtCore.QObject):
 
             # Check each vertex
             for idx, (vx, vy) in enumerate(zone.projector_mapping.vertices):
-                distance = math.sqrt((x - vx) ** 2 + (y - vy) ** 2)
+                dx = x - vx
+                dy = y - vy
+
+                # Cheap reject outside the max_distance square
+                if abs(dx) > max_distance or abs(dy) > max_distance:
+                    continue
 
                 # Check if within max_distance and closer than previous best
-                if distance <= max_distance and distance < closest_distance:
-                    closest_distance = distance
+                distance_sq = dx * dx + dy * dy
+                if distance_sq <= max_distance_sq and distance_sq < closest_distance_sq:
+                    closest_distance_sq = distance_sq
                     closest_zone = zone
                     closest_vertex_idx = idx
 
@@ -281,6 +281,7 @@ class Game(GameBase):
         # Overlay images for visualization (zone_name -> BGRA image)
         self.camera_overlays: dict[str, np.ndarray] = {}
         self.projector_overlays: dict[str, np.ndarray] = {}
+        self.overlay_revisions: dict[str, int] = {}  # zone_name -> redraw counter
         self.zone_mapping: dict[str, str] = {}  # internal_name -> actual zone_name
 
     def get_metadata(self) -> dict[str, str]:
@@ -413,6 +414,7 @@ class Game(GameBase):
         # Clear overlays
         self.camera_overlays.clear()
         self.projector_overlays.clear()
+        self.overlay_revisions.clear()
         self.zone_mapping.clear()
 
         self.is_running = False
@@ -442,6 +444,28 @@ class Game(GameBase):
         """
         return self.projector_overlays.get(zone_name)
 
+    def get_camera_overlay_revision(self, zone_name: str):
+        """Get the camera overlay revision for a specific zone.
+
+        Args:
+            zone_name: Name of the zone to get overlay revision for.
+
+        Returns:
+            Number of times the zone overlays were redrawn, or None if never.
+        """
+        return self.overlay_revisions.get(zone_name)
+
+    def get_projector_overlay_revision(self, zone_name: str):
+        """Get the projector overlay revision for a specific zone.
+
+        Args:
+            zone_name: Name of the zone to get overlay revision for.
+
+        Returns:
+            Number of times the zone overlays were redrawn, or None if never.
+        """
+        return self.overlay_revisions.get(zone_name)
+
     @QtCore.Slot(float)
     def _on_division_size_changed(self, size: float) -> None:
         """Handle division size change.
@@ -553,3 +577,6 @@ class Game(GameBase):
                 cv2.rectangle(camera_overlay, (x, y), (x + corner_size_px, y + corner_size_px), color, -1)
             if projector_overlay is not None:
                 cv2.rectangle(projector_overlay, (x, y), (x + corner_size_px, y + corner_size_px), color, -1)
+
+        # Let the viewports know the overlays changed
+        self.overlay_revisions[play_area_name] = self.overlay_revisions.get(play_area_name, 0) + 1
@@ -88,15 +88,36 @@ class QRDetectionEventManager(GameEventManager):
             # Calculate circle radius in pixels (0.6 inches * pixels per unit)
             radius_px = int(0.6 * zone.resolution)
 
+            # Calculate centers from corners (in camera ROI coordinates), skipping
+            # detections whose corners do not give a finite center
+            centers_roi = []
             for detection in detections:
-                # Calculate center from corners (in camera ROI coordinates)
-                corners = np.array(detection.corners, dtype=np.float32)
-                center_roi = np.mean(corners, axis=0)
-
-                # Convert from camera ROI coordinates to game coordinates (in pixels)
                 try:
-                    center_game_px = zone.camera_to_game((center_roi[0], center_roi[1]))
-
+                    corners = np.asarray(detection.corners, dtype=np.float32)
+                except (TypeError, ValueError):
+                    corners = None
+                center_roi = None
+                if corners is not None and corners.ndim == 2 and corners.shape[0] > 0 and corners.shape[1] == 2:
+                    center_roi = np.mean(corners, axis=0)
+                if center_roi is None or not np.all(np.isfinite(center_roi)):
+                    print(f"[QRDetectionEventManager] Skipping QR detection with invalid corners: {detection.corners}")
+                    continue
+                centers_roi.append(center_roi)
+
+            # Convert all centers from camera ROI coordinates to game coordinates (in pixels)
+            # at once, falling back to one center at a time so a failure only drops its circle
+            try:
+                centers_game_px = list(zone.camera_to_game_batch(np.array(centers_roi, dtype=np.float32).reshape(-1, 2)))
+            except Exception:
+                centers_game_px = []
+                for center_roi in centers_roi:
+                    try:
+                        centers_game_px.append(zone.camera_to_game((center_roi[0], center_roi[1])))
+                    except Exception as e:
+                        print(f"[QRDetectionEventManager] Error converting QR detection to game coordinates: {e}")
+
+            for center_game_px in centers_game_px:
+                try:
                     # Use game pixel coordinates directly for overlay (already in pixels)
                     center_px = (
                         int(center_game_px[0]),
@@ -113,6 +134,9 @@ class QRDetectionEventManager(GameEventManager):
                 except Exception as e:
                     print(f"[QRDetectionEventManager] Error converting QR detection to game coordinates: {e}")
 
+        # Let the viewports know the overlays changed
+        self.game.overlay_revisions[zone_name] = self.game.overlay_revisions.get(zone_name, 0) + 1
+
     @QtCore.Slot(str)
     def process_game_speech(self, text: str) -> None:
         """Process speech recognition results.
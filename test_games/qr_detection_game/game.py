@@ -209,6 +209,7 @@ class Game(GameBase):
         # Overlay images for visualization (zone_name -> BGRA image)
         self.camera_overlays: dict[str, np.ndarray] = {}
         self.projector_overlays: dict[str, np.ndarray] = {}
+        self.overlay_revisions: dict[str, int] = {}  # zone_name -> redraw counter
         self.zone_mapping: dict[str, str] = {}  # internal_name -> actual zone_name
 
     def get_metadata(self) -> dict[str, str]:
@@ -369,6 +370,7 @@ class Game(GameBase):
         # Clear overlays
         self.camera_overlays.clear()
         self.projector_overlays.clear()
+        self.overlay_revisions.clear()
         self.zone_mapping.clear()
 
         self.is_running = False
@@ -407,3 +409,25 @@ class Game(GameBase):
             or None if no overlay for this zone.
         """
         return self.projector_overlays.get(zone_name)
+
+    def get_camera_overlay_revision(self, zone_name: str):
+        """Get the camera overlay revision for a specific zone.
+
+        Args:
+            zone_name: Name of the zone to get overlay revision for.
+
+        Returns:
+            Number of times the zone overlays were redrawn, or None if never.
+        """
+        return self.overlay_revisions.get(zone_name)
+
+    def get_projector_overlay_revision(self, zone_name: str):
+        """Get the projector overlay revision for a specific zone.
+
+        Args:
+            zone_name: Name of the zone to get overlay revision for.
+
+        Returns:
+            Number of times the zone overlays were redrawn, or None if never.
+        """
+        return self.overlay_revisions.get(zone_name)
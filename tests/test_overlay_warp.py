@@ -0,0 +1,199 @@
+# Copyright 2026 Marc-Antoine Desjardins
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the overlay warping module.
+
+Checks the dirty rectangle detection, the in-place re-warp of a changed region
+against a full warp, and when update_game_overlay_warp reuses its cached warp.
+"""
+
+import os
+import sys
+
+import cv2 as cv
+import numpy as np
+
+root_dir_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+python_path = os.path.join(root_dir_path, "python")
+if python_path not in sys.path:
+    sys.path.append(python_path)
+
+from ttga.overlay_warp import (  # noqa: E402
+    get_dirty_rect,
+    rewarp_game_overlay_rect,
+    update_game_overlay_warp,
+    warp_game_overlay,
+)
+
+GAME_SIZE = (440, 280)
+FRAME_SIZE = (640, 480)
+
+
+def _make_mapping(offset: float = 0.0) -> tuple[np.ndarray, dict]:
+    """Get a game to frame perspective matrix and the matching ROI.
+
+    Args:
+        offset: Horizontal offset of the top right corner, to get another mapping.
+
+    Returns:
+        Tuple of (matrix, roi).
+    """
+    width, height = GAME_SIZE
+    src = np.float32([[0, 0], [width, 0], [width, height], [0, height]])
+    dst = np.float32([[60, 40], [560 + offset, 70], [590, 420], [30, 400]])
+    matrix = cv.getPerspectiveTransform(src, dst)
+    roi = {
+        'min_x': int(dst[:, 0].min()), 'min_y': int(dst[:, 1].min()),
+        'max_x': int(np.ceil(dst[:, 0].max())), 'max_y': int(np.ceil(dst[:, 1].max()))
+    }
+    # warp_game_overlay expects the matrix to map into ROI coordinates
+    shift = np.array([[1.0, 0.0, -roi['min_x']], [0.0, 1.0, -roi['min_y']], [0.0, 0.0, 1.0]])
+    return shift @ matrix, roi
+
+
+def _make_game_overlay() -> np.ndarray:
+    """Get a game overlay with a few semi-transparent shapes.
+
+    Returns:
+        Game overlay (numpy BGRA).
+    """
+    width, height = GAME_SIZE
+    overlay = np.zeros((height, width, 4), dtype=np.uint8)
+    cv.circle(overlay, (150, 120), 60, (0, 200, 0, 180), -1, cv.LINE_AA)
+    cv.rectangle(overlay, (250, 40), (400, 200), (200, 0, 50, 255), 3, cv.LINE_AA)
+    return overlay
+
+
+def test_get_dirty_rect() -> None:
+    """Test the changed region of identical, edited and resized overlays."""
+    previous = _make_game_overlay()
+    assert get_dirty_rect(previous, previous.copy()) is None
+
+    current = previous.copy()
+    current[30, 40, 2] = 7
+    current[90, 12, 3] = 1
+    assert get_dirty_rect(previous, current) == (12, 30, 41, 91)
+
+    resized = np.zeros((10, 20, 4), dtype=np.uint8)
+    assert get_dirty_rect(previous, resized) == (0, 0, 20, 10)
+
+
+def test_rewarp_matches_full_warp() -> None:
+    """Test that re-warping the changed region matches warping everything again."""
+    matrix, roi = _make_mapping()
+    previous = _make_game_overlay()
+    warped, _, _, _ = warp_game_overlay(previous, matrix, roi, *FRAME_SIZE)
+
+    edits = [
+        lambda overlay: cv.circle(overlay, (60, 220), 25, (0, 0, 255, 200), -1, cv.LINE_AA),
+        lambda overlay: cv.rectangle(overlay, (250, 40), (400, 200), (0, 0, 0, 0), -1),
+        lambda overlay: cv.line(overlay, (0, 279), (439, 0), (255, 0, 0, 255), 2),
+        # Single pixel changes at the game overlay edges exercise the sampling margin
+        lambda overlay: overlay.__setitem__((0, 0), (255, 255, 255, 255)),
+        lambda overlay: overlay.__setitem__((279, 439), (255, 255, 255, 255)),
+    ]
+    for edit in edits:
+        current = previous.copy()
+        edit(current)
+        dirty_rect = get_dirty_rect(previous, current)
+        rewarped, _ = rewarp_game_overlay_rect(current, matrix, warped, dirty_rect)
+        expected, _, _, _ = warp_game_overlay(current, matrix, roi, *FRAME_SIZE)
+        assert rewarped is warped
+        assert np.abs(rewarped.astype(np.int16) - expected).max() <= 1
+        previous = current
+
+
+def test_update_reuses_warp_while_inputs_unchanged() -> None:
+    """Test that the cached warp is returned as-is for the same revision and mapping."""
+    matrix, roi = _make_mapping()
+    game_overlay = _make_game_overlay()
+
+    warp = update_game_overlay_warp(None, game_overlay, 1, matrix, roi, *FRAME_SIZE)
+    assert warp.has_content and warp.overlay_qimage is not None
+    assert update_game_overlay_warp(warp, game_overlay, 1, matrix, roi, *FRAME_SIZE) is warp
+
+
+def test_update_follows_revision_matrix_and_roi() -> None:
+    """Test that a new revision, matrix or ROI gives a warp matching the new inputs."""
+    matrix, roi = _make_mapping()
+    game_overlay = _make_game_overlay()
+    warp = update_game_overlay_warp(None, game_overlay, 1, matrix, roi, *FRAME_SIZE)
+
+    # New revision with edited pixels: re-warped (in place) to the new content
+    cv.circle(game_overlay, (60, 220), 25, (0, 0, 255, 200), -1, cv.LINE_AA)
+    updated = update_game_overlay_warp(warp, game_overlay, 2, matrix, roi, *FRAME_SIZE)
+    expected, _, _, _ = warp_game_overlay(game_overlay, matrix, roi, *FRAME_SIZE)
+    assert updated is not warp
+    assert np.abs(updated.overlay_argb.astype(np.int16) - expected).max() <= 1
+
+    # New matrix and ROI: warped again from scratch
+    other_matrix, other_roi = _make_mapping(offset=-40.0)
+    moved = update_game_overlay_warp(updated, game_overlay, 2, other_matrix, other_roi, *FRAME_SIZE)
+    expected, _, x, y = warp_game_overlay(game_overlay, other_matrix, other_roi, *FRAME_SIZE)
+    assert moved is not updated
+    assert (moved.x, moved.y) == (x, y)
+    assert np.array_equal(moved.overlay_argb, expected)
+    assert moved.has_content
+
+
+def test_update_without_revision_keeps_unchanged_pixels() -> None:
+    """Test that an overlay without revision keeps its warp while its pixels are unchanged."""
+    matrix, roi = _make_mapping()
+    game_overlay = _make_game_overlay()
+    warp = update_game_overlay_warp(None, game_overlay, None, matrix, roi, *FRAME_SIZE)
+    overlay_qimage = warp.overlay_qimage
+
+    warp = update_game_overlay_warp(warp, game_overlay, None, matrix, roi, *FRAME_SIZE)
+    assert warp.overlay_qimage is overlay_qimage
+
+    game_overlay[100:110, 100:110] = (255, 0, 0, 255)
+    warp = update_game_overlay_warp(warp, game_overlay, None, matrix, roi, *FRAME_SIZE)
+    expected, _, _, _ = warp_game_overlay(game_overlay, matrix, roi, *FRAME_SIZE)
+    assert warp.overlay_qimage is not overlay_qimage
+    assert np.abs(warp.overlay_argb.astype(np.int16) - expected).max() <= 1
+
+
+def test_update_clears_warp_when_transparent() -> None:
+    """Test that an overlay becoming fully transparent leaves nothing to draw."""
+    matrix, roi = _make_mapping()
+    game_overlay = _make_game_overlay()
+    warp = update_game_overlay_warp(None, game_overlay, 1, matrix, roi, *FRAME_SIZE)
+    assert warp.overlay_argb is not None
+
+    game_overlay[:] = 0
+    warp = update_game_overlay_warp(warp, game_overlay, 2, matrix, roi, *FRAME_SIZE)
+    assert not warp.has_content
+    assert warp.overlay_argb is None and warp.overlay_qimage is None
+
+
+def main() -> None:
+    """Main entry point for the tests."""
+    print("=" * 60)
+    print("Overlay Warp Tests")
+    print("=" * 60)
+
+    for test in (
+        test_get_dirty_rect,
+        test_rewarp_matches_full_warp,
+        test_update_reuses_warp_while_inputs_unchanged,
+        test_update_follows_revision_matrix_and_roi,
+        test_update_without_revision_keeps_unchanged_pixels,
+        test_update_clears_warp_when_transparent,
+    ):
+        test()
+        print(f"  {test.__name__}: OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# Copyright 2026 Marc-Antoine Desjardins
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the zone coordinate transforms.
+
+Checks that the batch transforms match the single point transforms, that empty
+batches are handled, and that cached matrix entries follow the mapping.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+root_dir_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+python_path = os.path.join(root_dir_path, "python")
+if python_path not in sys.path:
+    sys.path.append(python_path)
+
+from ttga.zone import CameraMapping, ProjectorMapping, Zone  # noqa: E402
+
+CAMERA_VERTICES = [(2021, 136), (205, 177), (208, 1339), (2049, 1329)]
+PROJECTOR_VERTICES = [(40, 30), (1850, 60), (1800, 1040), (70, 1000)]
+
+
+def _make_zone() -> Zone:
+    """Get a zone with calibrated camera and projector mappings.
+
+    Returns:
+        Calibrated zone.
+    """
+    zone = Zone("test", width=34.0, height=22.0, unit='in', resolution=32)
+    zone.camera_mapping = CameraMapping("camera", vertices=list(CAMERA_VERTICES))
+    zone.projector_mapping = ProjectorMapping("projector", vertices=list(PROJECTOR_VERTICES))
+    zone.calibrate()
+    return zone
+
+
+def _get_transform_pairs(zone: Zone) -> list[tuple]:
+    """Get each single point transform of a zone with its batch variant.
+
+    Args:
+        zone: Calibrated zone.
+
+    Returns:
+        List of (name, transform, batch_transform).
+    """
+    return [
+        ("camera_to_game", zone.camera_to_game, zone.camera_to_game_batch),
+        ("game_to_camera", zone.game_to_camera, zone.game_to_camera_batch),
+        ("projector_to_game", zone.projector_to_game, zone.projector_to_game_batch),
+        ("game_to_projector", zone.game_to_projector, zone.game_to_projector_batch),
+    ]
+
+
+def test_batch_matches_single_point_transforms() -> None:
+    """Test that every batch transform equals its single point transform."""
+    zone = _make_zone()
+    rng = np.random.default_rng(0)
+    points = rng.uniform(0, 1000, size=(64, 2))
+
+    for name, transform, batch_transform in _get_transform_pairs(zone):
+        batch = batch_transform(points)
+        assert batch.shape == (len(points), 2), name
+        assert batch.dtype == np.float64, name
+        single = np.array([transform((x, y)) for x, y in points])
+        assert np.allclose(batch, single, rtol=1e-9, atol=1e-6), name
+
+
+def test_batch_accepts_empty_input() -> None:
+    """Test that batch transforms of no points return an empty (0, 2) array."""
+    zone = _make_zone()
+
+    for name, _, batch_transform in _get_transform_pairs(zone):
+        for points in (np.empty((0, 2)), []):
+            result = batch_transform(points)
+            assert result.shape == (0, 2), name
+
+
+def test_batch_requires_calibration() -> None:
+    """Test that batch transforms raise like the single point ones when not calibrated."""
+    zone = Zone("test")
+    for name, transform, batch_transform in _get_transform_pairs(zone):
+        for call in (lambda: transform((1.0, 2.0)), lambda: batch_transform([(1.0, 2.0)])):
+            try:
+                call()
+            except ValueError:
+                continue
+            raise AssertionError(f"{name} did not raise without calibration")
+
+
+def test_matrix_entries_follow_the_mapping() -> None:
+    """Test that cached matrix entries are dropped on vertex moves and follow recalibration."""
+    zone = _make_zone()
+    mapping = zone.camera_mapping
+    entries = mapping.get_matrix_entries('camera_to_game_matrix')
+    assert entries == tuple(mapping.camera_to_game_matrix.ravel().tolist())
+    assert mapping.matrix_entries
+
+    # Moving a vertex drops the cached entries (the matrix may be updated in place)
+    mapping.update_vertex(0, 2000, 150)
+    assert not mapping.matrix_entries
+    assert mapping.overlay_needs_update
+
+    # Recalibrating assigns new matrices, which the transforms pick up
+    zone.calibrate()
+    entries = mapping.get_matrix_entries('camera_to_game_matrix')
+    assert entries == tuple(mapping.camera_to_game_matrix.ravel().tolist())
+    # (camera positions are relative to the mapping's ROI)
+    moved = (2000 - mapping.roi['min_x'], 150 - mapping.roi['min_y'])
+    assert np.allclose(zone.game_to_camera((0.0, 0.0)), moved, atol=1e-6)
+    assert np.allclose(zone.camera_to_game(moved), (0.0, 0.0), atol=1e-6)
+
+    # Same for the projector mapping
+    projector_mapping = zone.projector_mapping
+    projector_mapping.get_matrix_entries('projector_to_game_matrix')
+    projector_mapping.update_vertex(1, 1840, 70)
+    assert not projector_mapping.matrix_entries
+    zone.calibrate()
+    width_px, _ = zone.get_game_dimensions()
+    roi = projector_mapping.roi
+    moved = (1840 - roi['min_x'], 70 - roi['min_y'])
+    assert np.allclose(zone.game_to_projector((width_px - 1, 0.0)), moved, atol=1e-6)
+
+
+def main() -> None:
+    """Main entry point for the tests."""
+    print("=" * 60)
+    print("Zone Transform Tests")
+    print("=" * 60)
+
+    for test in (
+        test_batch_matches_single_point_transforms,
+        test_batch_accepts_empty_input,
+        test_batch_requires_calibration,
+        test_matrix_entries_follow_the_mapping,
+    ):
+        test()
+        print(f"  {test.__name__}: OK")
+
+
+if __name__ == "__main__":
+    main()